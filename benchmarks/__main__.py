@@ -0,0 +1,114 @@
+import argparse
+import datetime
+import importlib.util
+import itertools
+import json
+import platform
+import subprocess
+import sys
+
+from .scenarios import SCENARIOS
+from .server import MockServer
+
+_COLUMNS = (
+    ("scenario", "<15", ""),
+    ("session", "<8", ""),
+    ("concurrency", ">11", ""),
+    ("requests", ">9", ""),
+    ("errors", ">7", ""),
+    ("rps", ">10", ".1f"),
+    ("p50", ">8", ".4f"),
+    ("p99", ">8", ".4f"),
+    ("cpu", ">7", ".2f"),
+    ("peak_rss_mb", ">11", ".1f"),
+)
+
+
+def _get_sessions() -> list[str]:
+    return [lib for lib in ("aiohttp", "httpx") if importlib.util.find_spec(lib) is not None]
+
+
+def _get_revision() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _format_row(result: dict, baseline: dict | None) -> str:
+    row = " ".join(f"{result[name]:{align}{spec}}" for name, align, spec in _COLUMNS)
+    if baseline is not None and baseline["rps"]:
+        row += f" {(result['rps'] / baseline['rps'] - 1) * 100:>+7.1f}%"
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="aioscrapper benchmarks")
+    parser.add_argument("-s", "--scenario", action="append", choices=SCENARIOS, help="default: all scenarios")
+    parser.add_argument("--session", action="append", choices=("aiohttp", "httpx"), help="default: all installed")
+    parser.add_argument("-c", "--concurrency", action="append", type=int, help="default: 64")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier for the number of requests")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--server-workers", type=int, default=1)
+    parser.add_argument("-o", "--output", help="write results as json")
+    parser.add_argument("--baseline", help="compare rps with a previous json output")
+    parser.add_argument("--list", action="store_true", help="list scenarios")
+    args = parser.parse_args()
+
+    if args.list:
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name:<15} {scenario.get_requests(args.scale):>8} {scenario.description}")
+        return
+
+    baseline = {}
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            for result in json.load(f)["results"]:
+                baseline[(result["scenario"], result["session"], result["concurrency"])] = result
+
+    results = []
+    print(" ".join(f"{name:{align}}" for name, align, _ in _COLUMNS))
+    with MockServer(workers=args.server_workers) as server:
+        for name, session, concurrency, _ in itertools.product(
+            args.scenario or list(SCENARIOS),
+            args.session or _get_sessions(),
+            args.concurrency or [64],
+            range(args.repeat),
+        ):
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.runner",
+                    f"--scenario={name}",
+                    f"--session={session}",
+                    f"--concurrency={concurrency}",
+                    f"--scale={args.scale}",
+                    f"--url={server.url}",
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            result = json.loads(output.stdout.splitlines()[-1])
+            results.append(result)
+            print(_format_row(result, baseline.get((name, session, concurrency))), flush=True)
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                    "revision": _get_revision(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "scale": args.scale,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
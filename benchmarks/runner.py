@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import sys
+import time
+from dataclasses import dataclass, asdict
+
+from aioscrapper import AIOScrapper
+from aioscrapper.config import Config, SchedulerConfig, SessionConfig, StatsConfig, RequestConfig
+
+from .scenarios import SCENARIOS
+
+
+@dataclass(slots=True)
+class BenchResult:
+    scenario: str
+    session: str
+    concurrency: int
+    requests: int
+    responses: int
+    errors: int
+    elapsed: float
+    rps: float
+    p50: float
+    p99: float
+    cpu: float
+    peak_rss_mb: float
+    bytes: int
+
+
+async def run_scenario(name: str, session: str, concurrency: int, scale: float, url: str) -> BenchResult:
+    scenario = SCENARIOS[name]
+    config = scenario.configure(
+        Config(
+            session=SessionConfig(lib=session, request=RequestConfig(timeout=60)),
+            scheduler=SchedulerConfig(concurrent_requests=concurrency, pending_requests=concurrency),
+            stats=StatsConfig(enabled=True, log_interval=None),
+        )
+    )
+    scrapper = scenario.build(url, scenario.get_requests(scale))
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    start_time = time.perf_counter()
+
+    executor = await AIOScrapper.create(
+        [scrapper],
+        pipelines=scenario.pipelines and scenario.pipelines(),
+        config=config,
+    )
+    await executor.start()
+    await executor.shutdown()
+    elapsed = time.perf_counter() - start_time
+    await executor.close(shutdown=False)
+
+    end_usage = resource.getrusage(resource.RUSAGE_SELF)
+    stats = executor.stats
+    p50, p99 = stats.get_latency().percentiles((0.5, 0.99))
+    return BenchResult(
+        scenario=name,
+        session=session,
+        concurrency=concurrency,
+        requests=stats.counters["requests"],
+        responses=stats.counters["responses"],
+        errors=stats.counters["request_errors"],
+        elapsed=elapsed,
+        rps=stats.counters["requests"] / elapsed,
+        p50=p50,
+        p99=p99,
+        cpu=end_usage.ru_utime + end_usage.ru_stime - usage.ru_utime - usage.ru_stime,
+        peak_rss_mb=end_usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024),
+        bytes=stats.counters["response_bytes"],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenario", required=True, choices=SCENARIOS)
+    parser.add_argument("--session", required=True)
+    parser.add_argument("--concurrency", type=int, required=True)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--url", required=True)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    result = asyncio.run(run_scenario(args.scenario, args.session, args.concurrency, args.scale, args.url))
+    print(json.dumps(asdict(result)))
+
+
+if __name__ == "__main__":
+    main()
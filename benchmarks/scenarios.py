@@ -0,0 +1,161 @@
+import hashlib
+import math
+import re
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable
+
+from aioscrapper import BaseScrapper, RequestSender
+from aioscrapper.config import Config, PipelineConfig, RetryConfig
+from aioscrapper.pipeline import BasePipeline
+from aioscrapper.types import Response
+
+_LINK_RE = re.compile(rb'href="([^"]+)"')
+
+
+class PagesScrapper(BaseScrapper):
+    def __init__(self, base_url: str, count: int, query: Callable[[int], str]) -> None:
+        self._base_url = base_url
+        self._count = count
+        self._query = query
+
+    async def start(self, request_sender: RequestSender) -> None:
+        for i in range(self._count):
+            await request_sender(f"{self._base_url}/page/{i}?{self._query(i)}", callback=self.parse, errback=self.error)
+
+    async def parse(self, response: Response) -> None:
+        response.bytes()
+
+    async def error(self, exc: Exception) -> None: ...
+
+
+class LinksScrapper(BaseScrapper):
+    def __init__(self, base_url: str, links: int, depth: int) -> None:
+        self._base_url = base_url
+        self._links = links
+        self._depth = depth
+
+    async def start(self, request_sender: RequestSender) -> None:
+        await request_sender(
+            f"{self._base_url}/links?links={self._links}&depth={self._depth}&size=2048",
+            callback=self.parse,
+            errback=self.error,
+        )
+
+    async def parse(self, response: Response, send_request: RequestSender) -> None:
+        for link in _LINK_RE.findall(response.bytes()):
+            await send_request(self._base_url + link.decode(), callback=self.parse, errback=self.error)
+
+    async def error(self, exc: Exception) -> None: ...
+
+
+@dataclass(slots=True)
+class BenchItem:
+    payload: bytes
+    pipeline_name: str = "bench"
+
+
+class ItemsScrapper(PagesScrapper):
+    def __init__(self, base_url: str, count: int, items: int) -> None:
+        super().__init__(base_url, count, lambda _: "size=1024")
+        self._items = items
+
+    async def parse(self, response: Response, pipeline: Any) -> None:
+        body = response.bytes()
+        for i in range(self._items):
+            await pipeline.put_item(BenchItem(payload=body + i.to_bytes(4, "little")))
+
+
+class HashPipeline(BasePipeline[BenchItem]):
+    def __init__(self, rounds: int = 50) -> None:
+        self._rounds = rounds
+        self.digest = b""
+
+    async def put_item(self, item: BenchItem) -> None:
+        digest = item.payload
+        for _ in range(self._rounds):
+            digest = hashlib.sha256(digest).digest()
+        self.digest = digest
+
+
+@dataclass(slots=True, frozen=True)
+class Scenario:
+    name: str
+    description: str
+    requests: int
+    build: Callable[[str, int], BaseScrapper]
+    pipelines: Callable[[], dict[str, list[BasePipeline]]] | None = None
+    configure: Callable[[Config], Config] = field(default=lambda config: config)
+
+    def get_requests(self, scale: float) -> int:
+        return max(int(self.requests * scale), 1)
+
+
+_STATUSES = (200, 200, 200, 200, 200, 200, 200, 404, 500, 503)
+
+
+def _get_depth(links: int, pages: int) -> int:
+    return max(round(math.log(pages * (links - 1) + 1, links)) - 1, 1)
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            name="small_pages",
+            description="many small pages with no server latency",
+            requests=100_000,
+            build=lambda url, n: PagesScrapper(url, n, lambda _: "size=512"),
+        ),
+        Scenario(
+            name="large_bodies",
+            description="1 MiB bodies",
+            requests=500,
+            build=lambda url, n: PagesScrapper(url, n, lambda _: "size=1048576"),
+        ),
+        Scenario(
+            name="latency",
+            description="50ms +- 20ms server latency",
+            requests=10_000,
+            build=lambda url, n: PagesScrapper(url, n, lambda _: "size=4096&latency=40&jitter=20"),
+        ),
+        Scenario(
+            name="status_mix",
+            description="30% error statuses with one retry",
+            requests=10_000,
+            build=lambda url, n: PagesScrapper(url, n, lambda i: f"size=1024&status={_STATUSES[i % len(_STATUSES)]}"),
+            configure=lambda config: replace(
+                config, retry=RetryConfig(max_attempts=2, backoff_base=0.001, backoff_max=0.01)
+            ),
+        ),
+        Scenario(
+            name="slow_drip",
+            description="bodies dripped in 10 chunks 20ms apart",
+            requests=1_000,
+            build=lambda url, n: PagesScrapper(url, n, lambda _: "size=65536&drip=10&drip_interval=20"),
+        ),
+        Scenario(
+            name="errors",
+            description="10% connection resets",
+            requests=10_000,
+            build=lambda url, n: PagesScrapper(
+                url,
+                n,
+                lambda i: "size=1024&error=reset" if i % 10 == 0 else "size=1024",
+            ),
+        ),
+        Scenario(
+            name="deep_links",
+            description="link following through a 4-ary page tree",
+            requests=21_845,
+            build=lambda url, n: LinksScrapper(url, links=4, depth=_get_depth(4, n)),
+        ),
+        Scenario(
+            name="heavy_pipeline",
+            description="10 CPU-bound pipeline items per page",
+            requests=5_000,
+            build=lambda url, n: ItemsScrapper(url, n, items=10),
+            pipelines=lambda: {"bench": [HashPipeline()]},
+            configure=lambda config: replace(config, pipeline=PipelineConfig(queue_size=1024, workers=4)),
+        ),
+    )
+}
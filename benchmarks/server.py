@@ -0,0 +1,140 @@
+import asyncio
+import multiprocessing
+import random
+import socket
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+_REASONS = {200: "OK", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error", 503: "Unavailable"}
+
+
+class MockServerProtocol(asyncio.Protocol):
+    def __init__(self, bodies: dict[int, bytes]) -> None:
+        self._bodies = bodies
+        self._buffer = bytearray()
+        self._transport: asyncio.Transport | None = None
+        self._last: asyncio.Future | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._transport = None
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer += data
+        while (end := self._buffer.find(b"\r\n\r\n")) != -1:
+            head = bytes(self._buffer[:end]).decode("latin-1").split("\r\n")
+            length = 0
+            for line in head[1:]:
+                name, _, value = line.partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            if len(self._buffer) < end + 4 + length:
+                return
+
+            del self._buffer[: end + 4 + length]
+            target = head[0].split(" ")[1]
+            self._last = asyncio.ensure_future(self._respond(target, self._last))
+
+    def _get_body(self, size: int) -> bytes:
+        body = self._bodies.get(size)
+        if body is None:
+            body = self._bodies[size] = b"x" * size
+        return body
+
+    def _render(self, path: str, params: dict[str, str]) -> bytes:
+        size = int(params.get("size", 0))
+        links, depth = int(params.get("links", 0)), int(params.get("depth", 0))
+        if not links or depth <= 0:
+            return self._get_body(size)
+
+        child = urlencode({**params, "depth": depth - 1})
+        html = "".join(f'<a href="{path.rstrip("/")}/{i}?{child}">{i}</a>' for i in range(links)).encode()
+        return html + self._get_body(max(size - len(html), 0))
+
+    async def _respond(self, target: str, previous: asyncio.Future | None) -> None:
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query))
+        if (latency := float(params.get("latency", 0)) + random.uniform(0, float(params.get("jitter", 0)))) > 0:
+            await asyncio.sleep(latency / 1000)
+        if previous is not None:
+            await previous
+        if self._transport is None:
+            return
+
+        if (error := params.get("error")) == "reset":
+            self._transport.abort()
+            return
+        elif error == "close":
+            self._transport.close()
+            return
+
+        status = int(params.get("status", 200))
+        body = self._render(url.path, params)
+        head = f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}\r\nContent-Type: text/html\r\n"
+        if (drip := int(params.get("drip", 0))) <= 0:
+            self._transport.write(f"{head}Content-Length: {len(body)}\r\n\r\n".encode() + body)
+            return
+
+        self._transport.write(f"{head}Transfer-Encoding: chunked\r\n\r\n".encode())
+        step = max(len(body) // drip, 1)
+        interval = float(params.get("drip_interval", 10)) / 1000
+        for offset in range(0, len(body), step):
+            chunk = body[offset : offset + step]
+            if self._transport is None:
+                return
+            self._transport.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            await asyncio.sleep(interval)
+        if self._transport is not None:
+            self._transport.write(b"0\r\n\r\n")
+
+
+async def _serve(sock: socket.socket) -> None:
+    bodies: dict[int, bytes] = {}
+    server = await asyncio.get_running_loop().create_server(lambda: MockServerProtocol(bodies), sock=sock)
+    async with server:
+        await server.serve_forever()
+
+
+def _run(sock: socket.socket) -> None:
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(_serve(sock))
+    else:
+        uvloop.run(_serve(sock))
+
+
+class MockServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, workers: int = 1) -> None:
+        self._host = host
+        self._port = port
+        self._workers = workers
+        self._processes: list[multiprocessing.Process] = []
+        self._socket: socket.socket | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._host}:{self._port}"
+
+    def start(self) -> None:
+        self._socket = socket.create_server((self._host, self._port), backlog=4096)
+        self._port = self._socket.getsockname()[1]
+        for _ in range(self._workers):
+            process = multiprocessing.Process(target=_run, args=(self._socket,), daemon=True)
+            process.start()
+            self._processes.append(process)
+
+    def stop(self) -> None:
+        for process in self._processes:
+            process.terminate()
+            process.join()
+        if self._socket is not None:
+            self._socket.close()
+
+    def __enter__(self) -> "MockServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
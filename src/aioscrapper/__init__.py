@@ -4,7 +4,8 @@ __author__ = "darkstussy"
 
 __copyright__ = f"Copyright (c) 2025 {__author__}"
 
+from .offload import offload, FollowRequest
 from .request_sender import RequestSender
 from .scrapper import AIOScrapper, BaseScrapper
 
-__all__ = ["AIOScrapper", "BaseScrapper", "RequestSender"]
+__all__ = ["AIOScrapper", "BaseScrapper", "RequestSender", "offload", "FollowRequest"]
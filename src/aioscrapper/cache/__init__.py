@@ -0,0 +1,13 @@
+from .base import BaseCacheStorage, CacheEntry
+from .filesystem import FilesystemCacheStorage
+from .sqlite import SQLiteCacheStorage
+from ..config import CacheConfig
+
+
+def get_cache_storage(config: CacheConfig) -> BaseCacheStorage:
+    if config.backend == "filesystem":
+        return FilesystemCacheStorage(config.path, ttl=config.ttl, max_size=config.max_size)
+    if config.backend == "sqlite":
+        return SQLiteCacheStorage(config.path, ttl=config.ttl, max_size=config.max_size)
+
+    raise RuntimeError(f"Unknown cache backend: {config.backend}")
@@ -0,0 +1,81 @@
+import abc
+import asyncio
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Any, Callable
+
+from ..types import Response, CIHeaders, QueryParams
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    url: str
+    method: str
+    status: int
+    headers: list[tuple[str, str]]
+    cookies: dict[str, str]
+    content: bytes
+    content_type: str | None
+    stored_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    @classmethod
+    def from_response(cls, response: Response, stored_at: float) -> "CacheEntry":
+        return cls(
+            url=response.url,
+            method=response.method,
+            status=response.status or 0,
+            headers=list((response.headers or {}).items()),
+            cookies=dict(response.cookies or {}),
+            content=response.bytes() or b"",
+            content_type=response.content_type,
+            stored_at=stored_at,
+        )
+
+    def to_response(self, params: QueryParams | None) -> Response:
+        return Response(
+            url=self.url,
+            method=self.method,
+            params=params,
+            status=self.status,
+            headers=CIHeaders(self.headers),
+            cookies=self.cookies,
+            content=self.content,
+            content_type=self.content_type,
+        )
+
+    def dumps(self) -> bytes:
+        return pickle.dumps(tuple(getattr(self, name) for name in _ENTRY_FIELDS), protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def loads(cls, data: bytes) -> "CacheEntry":
+        return cls(*pickle.loads(data))
+
+
+_ENTRY_FIELDS = tuple(f.name for f in fields(CacheEntry))
+
+
+class BaseCacheStorage(abc.ABC):
+    def __init__(self, ttl: float | None = None, max_size: int | None = None) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aioscrapper-cache")
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> CacheEntry | None: ...
+
+    @abc.abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,79 @@
+import os
+import time
+from collections import OrderedDict
+
+from .base import BaseCacheStorage, CacheEntry
+
+
+class FilesystemCacheStorage(BaseCacheStorage):
+    def __init__(self, path: str, ttl: float | None = None, max_size: int | None = None) -> None:
+        super().__init__(ttl=ttl, max_size=max_size)
+        self._path = path
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        os.makedirs(path, exist_ok=True)
+        if max_size is not None:
+            self._load_index()
+
+    def _load_index(self) -> None:
+        files = []
+        for directory in os.scandir(self._path):
+            if directory.is_dir():
+                for file in os.scandir(directory.path):
+                    if not file.name.endswith(".tmp"):
+                        stat = file.stat()
+                        files.append((stat.st_atime, file.name, stat.st_size))
+
+        for _, key, size in sorted(files):
+            self._index[key] = size
+            self._size += size
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self._path, key[:2], key)
+
+    def _get(self, key: str) -> CacheEntry | None:
+        try:
+            with open(self._get_path(key), "rb") as f:
+                entry = CacheEntry.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if self._ttl is not None and time.time() - entry.stored_at > self._ttl:
+            self._delete(key)
+            return None
+
+        if key in self._index:
+            self._index.move_to_end(key)
+        return entry
+
+    async def get(self, key: str) -> CacheEntry | None:
+        return await self._run(self._get, key)
+
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        path = self._get_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = entry.dumps()
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(data)
+        os.replace(f"{path}.tmp", path)
+
+        if self._max_size is None:
+            return
+
+        self._size += len(data) - self._index.pop(key, 0)
+        self._index[key] = len(data)
+        while self._size > self._max_size and len(self._index) > 1:
+            self._delete(next(iter(self._index)))
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        await self._run(self._set, key, entry)
+
+    def _delete(self, key: str) -> None:
+        self._size -= self._index.pop(key, 0)
+        try:
+            os.remove(self._get_path(key))
+        except FileNotFoundError:
+            pass
+
+    async def delete(self, key: str) -> None:
+        await self._run(self._delete, key)
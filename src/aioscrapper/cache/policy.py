@@ -0,0 +1,94 @@
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping
+
+from .base import CacheEntry
+from ..types import Request, Response, CIHeaders
+
+HEURISTICALLY_CACHEABLE_STATUSES = frozenset((200, 203, 204, 206, 300, 301, 308, 404, 405, 410, 414, 501))
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for directive in (value or "").split(","):
+        name, _, arg = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _parse_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_seconds(value: str | None) -> float | None:
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        return None
+
+
+def is_cacheable_request(request: Request) -> bool:
+    if request.method.upper() not in ("GET", "HEAD"):
+        return False
+    return "no-store" not in parse_cache_control((request.headers or {}).get("Cache-Control"))
+
+
+def is_storable(response: Response) -> bool:
+    headers = response.headers or {}
+    cache_control = parse_cache_control(headers.get("Cache-Control"))
+    if "no-store" in cache_control:
+        return False
+    if response.status in HEURISTICALLY_CACHEABLE_STATUSES:
+        return True
+    return "max-age" in cache_control or "Expires" in headers
+
+
+def get_freshness_lifetime(headers: Mapping[str, str]) -> float:
+    cache_control = parse_cache_control(headers.get("Cache-Control"))
+    if (max_age := _parse_seconds(cache_control.get("max-age"))) is not None:
+        return max_age
+
+    date = _parse_date(headers.get("Date"))
+    if (expires := _parse_date(headers.get("Expires"))) is not None:
+        return max(expires - (date or time.time()), 0.0)
+
+    if date is not None and (last_modified := _parse_date(headers.get("Last-Modified"))) is not None:
+        return max(date - last_modified, 0.0) / 10
+
+    return 0.0
+
+
+def is_fresh(entry: CacheEntry) -> bool:
+    headers = CIHeaders(entry.headers)
+    if "no-cache" in parse_cache_control(headers.get("Cache-Control")):
+        return False
+
+    age = (_parse_seconds(headers.get("Age")) or 0.0) + time.time() - entry.stored_at
+    return get_freshness_lifetime(headers) > age
+
+
+def get_conditional_headers(entry: CacheEntry) -> dict[str, str]:
+    headers = CIHeaders(entry.headers)
+    conditional = {}
+    if (etag := headers.get("ETag")) is not None:
+        conditional["If-None-Match"] = etag
+    if (last_modified := headers.get("Last-Modified")) is not None:
+        conditional["If-Modified-Since"] = last_modified
+    return conditional
+
+
+def update_from_not_modified(entry: CacheEntry, response: Response) -> None:
+    headers = dict(CIHeaders(entry.headers))
+    updated = CIHeaders((response.headers or {}).items())
+    for key in list(headers):
+        if key in updated:
+            del headers[key]
+    headers.update(updated)
+    entry.headers = list(headers.items())
+    entry.stored_at = time.time()
@@ -0,0 +1,75 @@
+import sqlite3
+import time
+
+from .base import BaseCacheStorage, CacheEntry
+
+
+class SQLiteCacheStorage(BaseCacheStorage):
+    def __init__(self, path: str, ttl: float | None = None, max_size: int | None = None) -> None:
+        super().__init__(ttl=ttl, max_size=max_size)
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, accessed_at REAL NOT NULL, size INTEGER NOT NULL, data BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)")
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+
+    def _get(self, key: str) -> CacheEntry | None:
+        row = self._conn.execute("SELECT data FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        entry = CacheEntry.loads(row[0])
+        if self._ttl is not None and time.time() - entry.stored_at > self._ttl:
+            self._delete(key)
+            return None
+
+        if self._max_size is not None:
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return entry
+
+    async def get(self, key: str) -> CacheEntry | None:
+        return await self._run(self._get, key)
+
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        data = entry.dumps()
+        self._delete(key)
+        self._conn.execute(
+            "INSERT INTO cache (key, accessed_at, size, data) VALUES (?, ?, ?, ?)",
+            (key, time.time(), len(data), data),
+        )
+        self._size += len(data)
+
+        if self._max_size is None:
+            return
+
+        while self._size > self._max_size:
+            rows = self._conn.execute(
+                "SELECT key, size FROM cache WHERE key != ? ORDER BY accessed_at LIMIT 100", (key,)
+            ).fetchall()
+            if not rows:
+                break
+
+            for row_key, size in rows:
+                if self._size <= self._max_size:
+                    break
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (row_key,))
+                self._size -= size
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        await self._run(self._set, key, entry)
+
+    def _delete(self, key: str) -> None:
+        row = self._conn.execute("DELETE FROM cache WHERE key = ? RETURNING size", (key,)).fetchone()
+        if row is not None:
+            self._size -= row[0]
+
+    async def delete(self, key: str) -> None:
+        await self._run(self._delete, key)
+
+    async def close(self) -> None:
+        await self._run(self._conn.close)
+        await super().close()
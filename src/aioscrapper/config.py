@@ -1,5 +1,7 @@
 import logging
-from dataclasses import dataclass
+import ssl
+import warnings
+from dataclasses import dataclass, field
 
 
 @dataclass(slots=True, frozen=True)
@@ -7,31 +9,236 @@ class RequestConfig:
     timeout: int = 60
     delay: float = 0.0
     ssl: bool = True
+    max_body_size: int | None = None
+    chunk_size: int = 65536
+
+
+@dataclass(slots=True, frozen=True)
+class CacheConfig:
+    enabled: bool = False
+    backend: str = "filesystem"
+    path: str = ".aioscrapper_cache"
+    ttl: float | None = None
+    max_size: int | None = None
+    rfc9111: bool = False
+    ignore_statuses: tuple[int, ...] = (429, 500, 502, 503, 504)
+
+
+@dataclass(slots=True, frozen=True)
+class ConnectionConfig:
+    limit: int | None = None
+    limit_per_host: int | None = None
+    keepalive_timeout: float | None = 15.0
+    keepalive_connections: int | None = 20
+    use_dns_cache: bool = True
+    dns_cache_ttl: int | None = 300
+    resolver: str | None = None
+    nameservers: tuple[str, ...] | None = None
+    happy_eyeballs_delay: float | None = 0.25
+    tcp_nodelay: bool = True
+    http2: bool = False
+    proxy_clients: int = 64
+    ssl_context: ssl.SSLContext | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ProxyConfig:
+    proxies: tuple[str, ...] = ()
+    strategy: str = "round_robin"
+    ban_statuses: tuple[int, ...] = (403, 407, 429)
+    max_failures: int = 3
+    eviction_time: float = 30.0
+    max_eviction_time: float = 600.0
+    smoothing: float = 0.2
 
 
 @dataclass(slots=True, frozen=True)
 class SessionConfig:
     lib: str | None = None
     request: RequestConfig = RequestConfig()
+    connection: ConnectionConfig = ConnectionConfig()
+    proxy: ProxyConfig = ProxyConfig()
+    cache: CacheConfig = CacheConfig()
+
+
+@dataclass(slots=True, frozen=True)
+class HostLimit:
+    max_in_flight: int | None = None
+    min_interval: float = 0.0
+
+
+@dataclass(slots=True, frozen=True)
+class HostSchedulerConfig:
+    default: HostLimit = HostLimit()
+    hosts: dict[str, HostLimit] = field(default_factory=dict)
+    idle_ttl: float | None = 300.0
+
+
+@dataclass(slots=True, frozen=True)
+class AutoThrottleConfig:
+    enabled: bool = False
+    target_concurrency: float = 1.0
+    start_delay: float = 1.0
+    min_delay: float = 0.0
+    max_delay: float = 60.0
+    start_concurrency: int = 1
+    max_concurrency: int = 16
+    throttle_statuses: tuple[int, ...] = (429, 503)
 
 
 @dataclass(slots=True, frozen=True)
 class SchedulerConfig:
     concurrent_requests: int = 64
     pending_requests: int = 1
+    concurrent_processing: int = 64
+    pending_processing: int = 1
+    response_buffer: int = 64
+    handoff_window: int | None = None
     close_timeout: float | None = 0.1
+    host: HostSchedulerConfig = HostSchedulerConfig()
+    autothrottle: AutoThrottleConfig = AutoThrottleConfig()
+
+
+@dataclass(slots=True, frozen=True)
+class RetryConfig:
+    max_attempts: int = 1
+    statuses: tuple[int, ...] = (408, 429, 500, 502, 503, 504)
+    exceptions: tuple[type[Exception], ...] = (Exception,)
+    backoff_base: float = 0.5
+    backoff_max: float = 60.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class HedgeConfig:
+    enabled: bool = False
+    percentile: float = 0.95
+    min_samples: int = 20
+    min_delay: float = 0.05
+    max_hedges: int = 1
+    methods: tuple[str, ...] = ("GET", "HEAD", "OPTIONS")
+    max_hosts: int = 10000
+
+
+@dataclass(slots=True, frozen=True)
+class RobotsConfig:
+    enabled: bool = False
+    user_agent: str = "*"
+    cache_size: int = 10000
+    ttl: float = 86400.0
+    error_ttl: float = 600.0
+    timeout: float = 10.0
+    max_size: int = 512 * 1024
+    respect_crawl_delay: bool = True
+    max_crawl_delay: float = 60.0
+
+
+@dataclass(slots=True, frozen=True)
+class DupeFilterConfig:
+    enabled: bool = False
+    backend: str = "memory"
+    digest_size: int = 8
+    capacity: int | None = None
+    error_rate: float = 0.001
+    path: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class QueueConfig:
+    max_size: int = 0
+    order: str = "fifo"
+    interleave_hosts: bool = False
+    max_depth: int | None = None
+    spill: bool = False
+    spill_path: str | None = None
+    spill_batch_size: int = 1000
+
+
+@dataclass(slots=True, frozen=True)
+class ScrapperLimit:
+    weight: float = 1.0
+    max_in_flight: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class FairShareConfig:
+    enabled: bool = True
+    default: ScrapperLimit = ScrapperLimit()
+    scrappers: dict[str, ScrapperLimit] = field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class PipelineConfig:
+    queue_size: int | None = None
+    workers: int = 1
+
+
+@dataclass(slots=True, frozen=True)
+class OffloadConfig:
+    executor: str = "process"
+    max_workers: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class DistributedConfig:
+    backend: str | None = None
+    path: str = "aioscrapper-frontier.sqlite"
+    worker_id: str | None = None
+    shards: int = 256
+    prefetch: int = 16
+    poll_interval: float = 0.5
+    idle_timeout: float = 2.0
+    heartbeat_interval: float = 5.0
+    lease_timeout: float = 30.0
+
+
+@dataclass(slots=True, frozen=True)
+class JobConfig:
+    path: str | None = None
+    checkpoint_interval: float = 30.0
+
+
+@dataclass(slots=True, frozen=True)
+class StatsConfig:
+    enabled: bool = False
+    log_interval: float | None = 60.0
+    quantiles: tuple[float, ...] = (0.5, 0.9, 0.99)
+    max_hosts: int = 1000
+    prometheus_port: int | None = None
+    prometheus_host: str = "127.0.0.1"
+    prometheus_prefix: str = "aioscrapper"
 
 
 @dataclass(slots=True, frozen=True)
 class ExecutionConfig:
     timeout: float | None = None
     shutdown_timeout: float = 0.1
-    shutdown_check_interval: float = 0.1
+    shutdown_check_interval: float | None = None
     log_level: int = logging.ERROR
 
+    def __post_init__(self) -> None:
+        if self.shutdown_check_interval is not None:
+            warnings.warn(
+                "ExecutionConfig.shutdown_check_interval is deprecated and has no effect",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+
 
 @dataclass(slots=True, frozen=True)
 class Config:
     session: SessionConfig = SessionConfig()
     scheduler: SchedulerConfig = SchedulerConfig()
+    retry: RetryConfig = RetryConfig()
+    hedge: HedgeConfig = HedgeConfig()
+    robots: RobotsConfig = RobotsConfig()
+    dupefilter: DupeFilterConfig = DupeFilterConfig()
+    queue: QueueConfig = QueueConfig()
+    fair_share: FairShareConfig = FairShareConfig()
+    job: JobConfig = JobConfig()
+    distributed: DistributedConfig = DistributedConfig()
+    pipeline: PipelineConfig = PipelineConfig()
+    offload: OffloadConfig = OffloadConfig()
+    stats: StatsConfig = StatsConfig()
     execution: ExecutionConfig = ExecutionConfig()
@@ -0,0 +1,12 @@
+from .base import BaseFrontierBackend
+from .queue import DistributedQueue
+from .ring import HashRing
+from .sqlite import SQLiteFrontierBackend
+from ..config import DistributedConfig
+
+
+def get_frontier_backend(config: DistributedConfig) -> BaseFrontierBackend:
+    if config.backend == "sqlite":
+        return SQLiteFrontierBackend(config.path)
+
+    raise RuntimeError(f"Unknown frontier backend: {config.backend}")
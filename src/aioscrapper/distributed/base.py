@@ -0,0 +1,29 @@
+import abc
+from typing import Sequence
+
+
+class BaseFrontierBackend(abc.ABC):
+    @abc.abstractmethod
+    async def push(self, shard: int, priority: int, data: bytes, fingerprint: bytes | None = None) -> bool: ...
+
+    @abc.abstractmethod
+    async def pop(self, worker_id: str, shards: Sequence[int], n: int) -> list[tuple[int, int, bytes]]: ...
+
+    @abc.abstractmethod
+    async def ack(self, lease_ids: Sequence[int]) -> None: ...
+
+    @abc.abstractmethod
+    async def release(self, lease_ids: Sequence[int]) -> None: ...
+
+    @abc.abstractmethod
+    async def heartbeat(self, worker_id: str, lease_timeout: float) -> list[str]: ...
+
+    @abc.abstractmethod
+    async def unregister(self, worker_id: str) -> None: ...
+
+    @abc.abstractmethod
+    async def count(self) -> int: ...
+
+    async def initialize(self) -> None: ...
+
+    async def close(self) -> None: ...
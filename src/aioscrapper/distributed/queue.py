@@ -0,0 +1,161 @@
+import asyncio
+import os
+import socket
+import time
+from typing import Iterator
+
+from .base import BaseFrontierBackend
+from .ring import HashRing, stable_hash
+from ..config import DistributedConfig, QueueConfig
+from ..dupefilter import get_request_fingerprint
+from ..frontier import BoundedPriorityQueue, RequestBuckets
+from ..scheduler import ActivityCounter, get_host
+from ..serialization import RequestCodec
+from ..types import PRPRequest
+
+
+class DistributedQueue(BoundedPriorityQueue):
+    def __init__(
+        self,
+        backend: BaseFrontierBackend,
+        codec: RequestCodec,
+        config: DistributedConfig,
+        dupefilter: bool = False,
+        digest_size: int = 8,
+        activity: ActivityCounter | None = None,
+        window: int | None = None,
+    ) -> None:
+        super().__init__(QueueConfig(), activity=activity, window=window)
+        self._backend = backend
+        self._codec = codec
+        self._distributed_config = config
+        self._dupefilter = dupefilter
+        self._digest_size = digest_size
+        self.worker_id = config.worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._buckets = RequestBuckets()
+        self._leases: dict[int, int] = {}
+        self._shards: list[int] = []
+        self._remote_size = 0
+        self._remote_active = False
+        self._idle_since: float | None = None
+        self._closed = False
+        self._heartbeat_task: asyncio.Task | None = None
+
+    def qsize(self) -> int:
+        return len(self._buckets) + self._remote_size
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def __iter__(self) -> Iterator[PRPRequest]:
+        return iter(self._buckets)
+
+    @property
+    def shards(self) -> list[int]:
+        return self._shards
+
+    def get_shard(self, url: str) -> int:
+        return stable_hash(get_host(url)) % self._distributed_config.shards
+
+    def _set_remote_size(self, size: int) -> None:
+        self._remote_size = size
+        if size > 0:
+            self._idle_since = None
+        elif self._idle_since is None:
+            self._idle_since = time.monotonic()
+
+        active = size > 0 or time.monotonic() - self._idle_since < self._distributed_config.idle_timeout
+        if self._activity is None or self._remote_active == active:
+            return
+
+        self._remote_active = active
+        if self._remote_active:
+            self._activity.inc()
+        else:
+            self._activity.dec()
+
+    async def initialize(self) -> None:
+        await self._backend.initialize()
+        await self._heartbeat()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def _heartbeat(self) -> None:
+        workers = await self._backend.heartbeat(self.worker_id, self._distributed_config.lease_timeout)
+        ring = HashRing(workers)
+        self._shards = [
+            shard
+            for shard in range(self._distributed_config.shards)
+            if ring.get_node(f"shard:{shard}") == self.worker_id
+        ]
+        self._set_remote_size(await self._backend.count())
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._distributed_config.heartbeat_interval)
+            await self._heartbeat()
+            self._wakeup.set()
+
+    async def put(self, item: PRPRequest | None) -> None:
+        if item is None:
+            self._closed = True
+            self._wakeup.set()
+            return
+
+        fingerprint = (
+            get_request_fingerprint(item.request, self._digest_size).to_bytes(self._digest_size, "little")
+            if self._dupefilter and not item.request_params.dont_filter
+            else None
+        )
+        shard = self.get_shard(item.request.url)
+        if await self._backend.push(shard, item.priority, self._codec.encode(item), fingerprint):
+            self._set_remote_size(self._remote_size + 1)
+            self._wakeup.set()
+
+    def put_nowait(self, item: PRPRequest | None) -> None:
+        raise NotImplementedError("DistributedQueue supports only async put")
+
+    async def get(self) -> PRPRequest | None:
+        while not self._closed:
+            if not self._is_window_full():
+                if self._buckets:
+                    r = self._buckets.pop()
+                    self._leased.add(id(r))
+                    return r
+
+                rows = await self._backend.pop(self.worker_id, self._shards, self._distributed_config.prefetch)
+                for lease_id, _, data in rows:
+                    r = self._codec.decode(data)
+                    self._leases[id(r)] = lease_id
+                    self._buckets.push(r)
+                    self._inc_activity(r)
+                if rows:
+                    continue
+
+                self._set_remote_size(await self._backend.count())
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._distributed_config.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+        return None
+
+    def get_nowait(self) -> PRPRequest | None:
+        raise NotImplementedError("DistributedQueue supports only async get")
+
+    async def ack(self, r: PRPRequest) -> None:
+        lease_id = self._leases.pop(id(r), None)
+        if lease_id is not None:
+            await self._backend.ack([lease_id])
+            self._set_remote_size(self._remote_size - 1 if self._remote_size > 1 else await self._backend.count())
+            await super().ack(r)
+
+    def restore(self, requests: Iterator[PRPRequest]) -> None:
+        raise NotImplementedError("DistributedQueue state is kept by the frontier backend")
+
+    async def close(self) -> None:
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+        await self._backend.release(list(self._leases.values()))
+        await self._backend.unregister(self.worker_id)
+        await self._backend.close()
@@ -0,0 +1,18 @@
+import bisect
+import hashlib
+from typing import Iterable
+
+
+def stable_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "little")
+
+
+class HashRing:
+    def __init__(self, nodes: Iterable[str], replicas: int = 64) -> None:
+        self._ring = sorted((stable_hash(f"{node}#{i}"), node) for node in nodes for i in range(replicas))
+        self._keys = [key for key, _ in self._ring]
+
+    def get_node(self, key: str) -> str | None:
+        if not self._ring:
+            return None
+        return self._ring[bisect.bisect(self._keys, stable_hash(key)) % len(self._ring)][1]
@@ -0,0 +1,117 @@
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence
+
+from .base import BaseFrontierBackend
+
+
+class SQLiteFrontierBackend(BaseFrontierBackend):
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        self._path = path
+        self._timeout = timeout
+        self._conn: sqlite3.Connection | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aioscrapper-frontier")
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise RuntimeError("Frontier backend is not initialized")
+        return self._conn
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _initialize(self) -> None:
+        self._conn = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS requests (id INTEGER PRIMARY KEY, shard INTEGER NOT NULL, "
+            "priority INTEGER NOT NULL, data BLOB NOT NULL, worker TEXT)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS requests_shard ON requests (shard, worker, priority, id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS requests_worker ON requests (worker)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS fingerprints (fingerprint BLOB PRIMARY KEY) WITHOUT ROWID")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS workers (id TEXT PRIMARY KEY, heartbeat REAL NOT NULL)")
+
+    async def initialize(self) -> None:
+        await self._run(self._initialize)
+
+    def _push(self, shard: int, priority: int, data: bytes, fingerprint: bytes | None) -> bool:
+        conn = self.conn
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if fingerprint is not None:
+                cursor = conn.execute("INSERT OR IGNORE INTO fingerprints (fingerprint) VALUES (?)", (fingerprint,))
+                if cursor.rowcount == 0:
+                    return False
+
+            conn.execute("INSERT INTO requests (shard, priority, data) VALUES (?, ?, ?)", (shard, priority, data))
+            return True
+
+    async def push(self, shard: int, priority: int, data: bytes, fingerprint: bytes | None = None) -> bool:
+        return await self._run(self._push, shard, priority, data, fingerprint)
+
+    def _pop(self, worker_id: str, shards: Sequence[int], n: int) -> list[tuple[int, int, bytes]]:
+        placeholders = ",".join("?" * len(shards))
+        return self.conn.execute(
+            f"UPDATE requests SET worker = ? WHERE id IN ("
+            f"SELECT id FROM requests WHERE worker IS NULL AND shard IN ({placeholders}) ORDER BY priority, id LIMIT ?"
+            f") RETURNING id, priority, data",
+            (worker_id, *shards, n),
+        ).fetchall()
+
+    async def pop(self, worker_id: str, shards: Sequence[int], n: int) -> list[tuple[int, int, bytes]]:
+        if not shards:
+            return []
+        return await self._run(self._pop, worker_id, shards, n)
+
+    def _ack(self, lease_ids: Sequence[int]) -> None:
+        self.conn.executemany("DELETE FROM requests WHERE id = ?", ((lease_id,) for lease_id in lease_ids))
+
+    async def ack(self, lease_ids: Sequence[int]) -> None:
+        await self._run(self._ack, lease_ids)
+
+    def _release(self, lease_ids: Sequence[int]) -> None:
+        self.conn.executemany("UPDATE requests SET worker = NULL WHERE id = ?", ((lease_id,) for lease_id in lease_ids))
+
+    async def release(self, lease_ids: Sequence[int]) -> None:
+        await self._run(self._release, lease_ids)
+
+    def _heartbeat(self, worker_id: str, lease_timeout: float) -> list[str]:
+        conn = self.conn
+        now = time.time()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT OR REPLACE INTO workers (id, heartbeat) VALUES (?, ?)", (worker_id, now))
+            rows = conn.execute("SELECT id FROM workers WHERE heartbeat < ?", (now - lease_timeout,))
+            dead = [row[0] for row in rows]
+            for dead_worker in dead:
+                conn.execute("UPDATE requests SET worker = NULL WHERE worker = ?", (dead_worker,))
+                conn.execute("DELETE FROM workers WHERE id = ?", (dead_worker,))
+            return sorted(row[0] for row in conn.execute("SELECT id FROM workers"))
+
+    async def heartbeat(self, worker_id: str, lease_timeout: float) -> list[str]:
+        return await self._run(self._heartbeat, worker_id, lease_timeout)
+
+    def _count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM requests").fetchone()[0]
+
+    async def count(self) -> int:
+        return await self._run(self._count)
+
+    def _unregister(self, worker_id: str) -> None:
+        self.conn.execute("DELETE FROM workers WHERE id = ?", (worker_id,))
+
+    async def unregister(self, worker_id: str) -> None:
+        await self._run(self._unregister, worker_id)
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+
+    async def close(self) -> None:
+        await self._run(self._close)
+        self._executor.shutdown(wait=False)
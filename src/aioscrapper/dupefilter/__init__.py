@@ -0,0 +1,16 @@
+from .base import BaseDupeFilter
+from .bloom import BloomDupeFilter
+from .fingerprint import get_request_fingerprint, canonicalize_url
+from .memory import MemoryDupeFilter, FingerprintSet
+from ..config import DupeFilterConfig
+
+
+def get_dupefilter(config: DupeFilterConfig) -> BaseDupeFilter | None:
+    if not config.enabled:
+        return None
+    if config.backend == "memory":
+        return MemoryDupeFilter(digest_size=config.digest_size, capacity=config.capacity or 1024, path=config.path)
+    if config.backend == "bloom":
+        return BloomDupeFilter(capacity=config.capacity or 10_000_000, error_rate=config.error_rate, path=config.path)
+
+    raise RuntimeError(f"Unknown dupefilter backend: {config.backend}")
@@ -0,0 +1,16 @@
+import abc
+
+
+class BaseDupeFilter(abc.ABC):
+    @abc.abstractmethod
+    def add(self, fingerprint: int) -> bool: ...
+
+    @abc.abstractmethod
+    def __contains__(self, fingerprint: int) -> bool: ...
+
+    def save(self) -> None: ...
+
+    async def initialize(self) -> None: ...
+
+    async def close(self) -> None:
+        self.save()
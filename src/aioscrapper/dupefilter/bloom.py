@@ -0,0 +1,65 @@
+import math
+import os
+import struct
+
+from .base import BaseDupeFilter
+
+_MASK64 = (1 << 64) - 1
+_HEADER = struct.Struct("<QQQ")
+
+
+class BloomDupeFilter(BaseDupeFilter):
+    def __init__(self, capacity: int, error_rate: float = 0.001, path: str | None = None) -> None:
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self._bits = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self._hashes = max(round(self._bits / capacity * math.log(2)), 1)
+        self._array = bytearray((self._bits + 7) // 8)
+        self._size = 0
+        self._path = path
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _positions(self, fingerprint: int) -> list[int]:
+        h1 = fingerprint & _MASK64
+        h2 = ((fingerprint >> 64) or (h1 >> 32) or 1) | 1
+        return [(h1 + i * h2) % self._bits for i in range(self._hashes)]
+
+    def __contains__(self, fingerprint: int) -> bool:
+        array = self._array
+        return all(array[p >> 3] & (1 << (p & 7)) for p in self._positions(fingerprint))
+
+    def add(self, fingerprint: int) -> bool:
+        array = self._array
+        added = False
+        for p in self._positions(fingerprint):
+            if not array[p >> 3] & (1 << (p & 7)):
+                array[p >> 3] |= 1 << (p & 7)
+                added = True
+
+        if added:
+            self._size += 1
+        return added
+
+    async def initialize(self) -> None:
+        if self._path is None or not os.path.exists(self._path):
+            return
+
+        with open(self._path, "rb") as f:
+            bits, hashes, size = _HEADER.unpack(f.read(_HEADER.size))
+            if (bits, hashes) != (self._bits, self._hashes):
+                raise RuntimeError(f"Bloom filter {self._path} was created with different capacity or error rate")
+
+            f.readinto(self._array)
+        self._size = size
+
+    def save(self) -> None:
+        if self._path is None:
+            return
+
+        with open(f"{self._path}.tmp", "wb") as f:
+            f.write(_HEADER.pack(self._bits, self._hashes, self._size))
+            f.write(self._array)
+        os.replace(f"{self._path}.tmp", self._path)
@@ -0,0 +1,48 @@
+import hashlib
+import json
+from typing import Mapping
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from ..types import Request
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str, params: Mapping | None = None) -> str:
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend((k, str(v)) for k, v in params.items())
+
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(sorted(query)), ""))
+
+
+def _get_body(request: Request) -> bytes:
+    if request.json_data is not None:
+        return json.dumps(request.json_data, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+    data = request.data
+    if data is None:
+        return b""
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode()
+    if isinstance(data, Mapping):
+        return urlencode(sorted((str(k), str(v)) for k, v in data.items())).encode()
+    return repr(data).encode()
+
+
+def get_request_fingerprint(request: Request, digest_size: int = 8) -> int:
+    h = hashlib.blake2b(digest_size=digest_size)
+    h.update(request.method.upper().encode())
+    h.update(b"\0")
+    h.update(canonicalize_url(request.url, request.params).encode())
+    h.update(b"\0")
+    h.update(_get_body(request))
+    return int.from_bytes(h.digest(), "little")
@@ -0,0 +1,142 @@
+import os
+from array import array
+from typing import Iterator
+
+from .base import BaseDupeFilter
+
+_MASK64 = (1 << 64) - 1
+_FAST_GROWTH_LIMIT = 1 << 20
+
+
+class FingerprintSet:
+    def __init__(self, words: int = 1, capacity: int = 1024) -> None:
+        if words not in (1, 2):
+            raise ValueError("Only 64-bit and 128-bit fingerprints are supported")
+
+        self._words = words
+        self._size = 0
+        self._capacity = 1 << max(capacity * 10 // 7, 1).bit_length()
+        self._table = array("Q", bytes(8 * words * self._capacity))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _find(self, fingerprint: int) -> tuple[int, bool]:
+        table, mask = self._table, self._capacity - 1
+        lo, hi = fingerprint & _MASK64, fingerprint >> 64
+        i = lo & mask
+        if self._words == 1:
+            while value := table[i]:
+                if value == lo:
+                    return i, True
+                i = (i + 1) & mask
+        else:
+            while True:
+                a, b = table[2 * i], table[2 * i + 1]
+                if not a and not b:
+                    break
+                if a == lo and b == hi:
+                    return i, True
+                i = (i + 1) & mask
+        return i, False
+
+    def __contains__(self, fingerprint: int) -> bool:
+        return self._find(fingerprint or 1)[1]
+
+    def add(self, fingerprint: int) -> bool:
+        fingerprint = fingerprint or 1
+        if (self._size + 1) * 10 > self._capacity * 7:
+            self._resize(self._capacity * (4 if self._capacity < _FAST_GROWTH_LIMIT else 2))
+
+        i, found = self._find(fingerprint)
+        if found:
+            return False
+
+        if self._words == 1:
+            self._table[i] = fingerprint
+        else:
+            self._table[2 * i] = fingerprint & _MASK64
+            self._table[2 * i + 1] = fingerprint >> 64
+        self._size += 1
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        table = self._table
+        if self._words == 1:
+            yield from (value for value in table if value)
+        else:
+            for i in range(0, len(table), 2):
+                if table[i] or table[i + 1]:
+                    yield table[i] | (table[i + 1] << 64)
+
+    def _resize(self, capacity: int) -> None:
+        old = self._table
+        table = self._table = array("Q", bytes(8 * self._words * capacity))
+        self._capacity, mask = capacity, capacity - 1
+        if self._words == 1:
+            for value in old:
+                if value:
+                    i = value & mask
+                    while table[i]:
+                        i = (i + 1) & mask
+                    table[i] = value
+        else:
+            for a, b in zip(old[::2], old[1::2]):
+                if a or b:
+                    i = a & mask
+                    while table[2 * i] or table[2 * i + 1]:
+                        i = (i + 1) & mask
+                    table[2 * i], table[2 * i + 1] = a, b
+
+    def load(self, path: str) -> None:
+        data = array("Q")
+        with open(path, "rb") as f:
+            raw = f.read()
+        data.frombytes(raw[: len(raw) - len(raw) % (8 * self._words)])
+
+        size = self._size + len(data) // self._words
+        if size * 10 > self._capacity * 7:
+            self._resize(1 << (size * 10 // 7).bit_length())
+
+        if self._words == 1:
+            for fingerprint in data:
+                self.add(fingerprint)
+        else:
+            for i in range(0, len(data), 2):
+                self.add(data[i] | (data[i + 1] << 64))
+
+
+class MemoryDupeFilter(BaseDupeFilter):
+    def __init__(self, digest_size: int = 8, capacity: int = 1024, path: str | None = None) -> None:
+        self._words = digest_size // 8
+        self._fingerprints = FingerprintSet(words=self._words, capacity=capacity)
+        self._path = path
+        self._unsaved = array("Q")
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, fingerprint: int) -> bool:
+        return fingerprint in self._fingerprints
+
+    def add(self, fingerprint: int) -> bool:
+        if not self._fingerprints.add(fingerprint):
+            return False
+
+        if self._path is not None:
+            self._unsaved.append(fingerprint & _MASK64)
+            if self._words == 2:
+                self._unsaved.append(fingerprint >> 64)
+        return True
+
+    def save(self) -> None:
+        if self._path is None or not self._unsaved:
+            return
+
+        with open(self._path, "ab") as f:
+            self._unsaved.tofile(f)
+        del self._unsaved[:]
+
+    async def initialize(self) -> None:
+        if self._path is not None and os.path.exists(self._path):
+            self._fingerprints.load(self._path)
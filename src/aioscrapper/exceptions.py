@@ -1,13 +1,33 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .types import Response
+
+
 class ClientException(Exception):
     pass
 
 
 class HTTPException(ClientException):
-    def __init__(self, status_code: int, message: str | None, url: str, method: str) -> None:
+    def __init__(
+        self,
+        status_code: int,
+        message: str | None,
+        url: str,
+        method: str,
+        response: "Response | None" = None,
+    ) -> None:
         self.status_code = status_code
-        self.message = message
+        self._message = message
         self.url = url
         self.method = method
+        self.response = response
+
+    @property
+    def message(self) -> str | None:
+        if self._message is None and self.response is not None:
+            self._message = self.response.text()
+        return self._message
 
     def __str__(self) -> str:
         return f"{self.method} {self.url}: {self.status_code}: {self.message}"
@@ -21,3 +41,23 @@ class RequestException(ClientException):
 
     def __str__(self) -> str:
         return f"[{self.inner_exc.__class__.__name__}]: {self.method} {self.url}: {self.inner_exc}"
+
+
+class DeadlineExceededException(ClientException):
+    def __init__(self, deadline: float, url: str, method: str) -> None:
+        self.deadline = deadline
+        self.url = url
+        self.method = method
+
+    def __str__(self) -> str:
+        return f"{self.method} {self.url}: deadline exceeded"
+
+
+class ResponseTooLargeException(ClientException):
+    def __init__(self, max_size: int, url: str, method: str) -> None:
+        self.max_size = max_size
+        self.url = url
+        self.method = method
+
+    def __str__(self) -> str:
+        return f"{self.method} {self.url}: response body exceeds {self.max_size} bytes"
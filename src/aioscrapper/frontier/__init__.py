@@ -0,0 +1,5 @@
+from .buckets import RequestBuckets
+from .fair import FairQueue, ScrapperShare
+from .job import JobStore
+from .queue import BoundedPriorityQueue
+from .spill import SpillStore
@@ -0,0 +1,84 @@
+import heapq
+from collections import deque
+from typing import Iterator
+
+from ..scheduler import get_host
+from ..types import PRPRequest
+
+
+class _HostLevel:
+    __slots__ = ("_hosts", "_order", "_lifo", "_size")
+
+    def __init__(self, lifo: bool) -> None:
+        self._hosts: dict[str, deque[PRPRequest]] = {}
+        self._order: deque[str] = deque()
+        self._lifo = lifo
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[PRPRequest]:
+        for requests in self._hosts.values():
+            yield from requests
+
+    def append(self, r: PRPRequest) -> None:
+        host = get_host(r.request.url)
+        requests = self._hosts.get(host)
+        if requests is None:
+            requests = self._hosts[host] = deque()
+            self._order.append(host)
+        requests.append(r)
+        self._size += 1
+
+    def pop(self) -> PRPRequest:
+        host = self._order.popleft()
+        requests = self._hosts[host]
+        r = requests.pop() if self._lifo else requests.popleft()
+        if requests:
+            self._order.append(host)
+        else:
+            del self._hosts[host]
+        self._size -= 1
+        return r
+
+
+class RequestBuckets:
+    def __init__(self, order: str = "fifo", interleave_hosts: bool = False) -> None:
+        if order not in ("fifo", "lifo"):
+            raise RuntimeError(f"Unknown queue order: {order}")
+
+        self._lifo = order == "lifo"
+        self._interleave_hosts = interleave_hosts
+        self._levels: dict[int, deque[PRPRequest] | _HostLevel] = {}
+        self._priorities: list[int] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[PRPRequest]:
+        for level in self._levels.values():
+            yield from level
+
+    @property
+    def min_priority(self) -> int | None:
+        return self._priorities[0] if self._priorities else None
+
+    def push(self, r: PRPRequest) -> None:
+        level = self._levels.get(r.priority)
+        if level is None:
+            level = self._levels[r.priority] = _HostLevel(self._lifo) if self._interleave_hosts else deque()
+            heapq.heappush(self._priorities, r.priority)
+        level.append(r)
+        self._size += 1
+
+    def pop(self) -> PRPRequest:
+        priority = self._priorities[0]
+        level = self._levels[priority]
+        r = level.pop() if self._lifo or self._interleave_hosts else level.popleft()
+        if not level:
+            del self._levels[priority]
+            heapq.heappop(self._priorities)
+        self._size -= 1
+        return r
@@ -0,0 +1,174 @@
+from collections import deque
+from typing import Iterator
+
+from .buckets import RequestBuckets
+from .queue import BoundedPriorityQueue
+from .spill import SpillStore
+from ..config import QueueConfig, FairShareConfig, ScrapperLimit
+from ..scheduler import ActivityCounter
+from ..types import PRPRequest
+
+
+class ScrapperShare:
+    __slots__ = ("name", "weight", "max_in_flight", "buckets", "in_flight", "deficit")
+
+    def __init__(self, name: str | None, limit: ScrapperLimit, config: QueueConfig) -> None:
+        if limit.weight <= 0:
+            raise RuntimeError(f"Scrapper weight must be positive: {name}")
+
+        self.name = name
+        self.weight = limit.weight
+        self.max_in_flight = limit.max_in_flight
+        self.buckets = RequestBuckets(order=config.order, interleave_hosts=config.interleave_hosts)
+        self.in_flight = 0
+        self.deficit = 0.0
+
+    @property
+    def available(self) -> bool:
+        return self.max_in_flight is None or self.in_flight < self.max_in_flight
+
+
+class _FairFrontier:
+    def __init__(
+        self,
+        config: QueueConfig,
+        fair_share: FairShareConfig,
+        spill: SpillStore | None,
+    ) -> None:
+        self._config = config
+        self._fair_share = fair_share
+        self._memory_size = config.max_size or None
+        self._spill = spill
+        self._shares: dict[str | None, ScrapperShare] = {}
+        self._ring: deque[ScrapperShare] = deque()
+        self._size = 0
+        self._closed = False
+
+    def __len__(self) -> int:
+        return self._size + (len(self._spill) if self._spill is not None else 0) + self._closed
+
+    def __iter__(self) -> Iterator[PRPRequest]:
+        for share in self._shares.values():
+            yield from share.buckets
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def shares(self) -> dict[str | None, ScrapperShare]:
+        return self._shares
+
+    def get_share(self, name: str | None) -> ScrapperShare:
+        share = self._shares.get(name)
+        if share is None:
+            limit = self._fair_share.scrappers.get(name, self._fair_share.default)
+            share = self._shares[name] = ScrapperShare(name, limit, self._config)
+        return share
+
+    def _push_memory(self, r: PRPRequest, share: ScrapperShare) -> None:
+        if not share.buckets:
+            self._ring.append(share)
+        share.buckets.push(r)
+        self._size += 1
+
+    def _should_spill(self, share: ScrapperShare) -> bool:
+        if self._spill is None or self._memory_size is None or self._size < self._memory_size:
+            return False
+        return len(share.buckets) * len(self._shares) >= self._memory_size
+
+    def push(self, r: PRPRequest | None) -> None:
+        if r is None:
+            self._closed = True
+            return
+
+        share = self.get_share(r.request_params.scrapper)
+        if self._should_spill(share):
+            self._spill.push(r)
+        else:
+            self._push_memory(r, share)
+
+    def _refill(self) -> None:
+        if self._spill is None or self._spill.min_priority is None or self._memory_size is None:
+            return
+        if self._size * 2 <= self._memory_size or not any(share.available for share in self._ring):
+            for r in self._spill.pop_many(max(self._memory_size - self._size, 1)):
+                self._push_memory(r, self.get_share(r.request_params.scrapper))
+
+    def ready(self, force: bool = False) -> bool:
+        if self._closed:
+            return True
+
+        self._refill()
+        return bool(self._ring) if force else any(share.available for share in self._ring)
+
+    def pop(self, force: bool = False) -> PRPRequest | None:
+        if self._closed:
+            return None
+
+        while True:
+            share = self._ring[0]
+            if force or share.available:
+                if share.deficit < 1:
+                    share.deficit += share.weight
+                if share.deficit >= 1:
+                    break
+            self._ring.rotate(-1)
+
+        r = share.buckets.pop()
+        share.deficit -= 1
+        share.in_flight += 1
+        self._size -= 1
+        if not share.buckets:
+            self._ring.popleft()
+            share.deficit = 0.0
+        elif share.deficit < 1 or not (force or share.available):
+            self._ring.rotate(-1)
+        return r
+
+    def release(self, r: PRPRequest) -> None:
+        share = self._shares.get(r.request_params.scrapper)
+        if share is not None and share.in_flight > 0:
+            share.in_flight -= 1
+
+
+class FairQueue(BoundedPriorityQueue):
+    def __init__(
+        self,
+        config: QueueConfig,
+        fair_share: FairShareConfig,
+        window: int | None = None,
+        store: SpillStore | None = None,
+        activity: ActivityCounter | None = None,
+    ) -> None:
+        self._fair_share = fair_share
+        self._held: set[int] = set()
+        super().__init__(config, store=store, activity=activity, window=window)
+
+    def _create_frontier(self) -> _FairFrontier:
+        return _FairFrontier(
+            self._config,
+            self._fair_share,
+            self._store if self._config.spill else None,
+        )
+
+    def empty(self) -> bool:
+        return not self._queue.ready(self.full()) or self._is_window_full()
+
+    def _get(self) -> PRPRequest | None:
+        r = self._queue.pop(self.full())
+        if r is not None:
+            self._leased.add(id(r))
+            self._held.add(id(r))
+        return r
+
+    @property
+    def shares(self) -> dict[str | None, ScrapperShare]:
+        return self._queue.shares
+
+    def release(self, r: PRPRequest) -> None:
+        if id(r) in self._held:
+            self._held.remove(id(r))
+            self._queue.release(r)
+            self._wakeup.set()
+        super().release(r)
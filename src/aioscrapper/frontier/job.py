@@ -0,0 +1,56 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from .spill import SpillStore
+from ..serialization import RequestCodec
+from ..types import PRPRequest
+
+
+class JobStore(SpillStore):
+    def __init__(self, codec: RequestCodec, path: str, batch_size: int = 1000) -> None:
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aioscrapper-job")
+        super().__init__(codec, path=os.path.join(path, "requests.sqlite"), batch_size=batch_size)
+
+    def _setup(self) -> None:
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS snapshot (id INTEGER PRIMARY KEY, data BLOB NOT NULL)")
+
+    def load_snapshot(self) -> list[PRPRequest]:
+        return [self._codec.decode(row[0]) for row in self._conn.execute("SELECT data FROM snapshot ORDER BY id")]
+
+    def flush(self) -> None:
+        with self._lock:
+            super().flush()
+
+    def pop_many(self, n: int) -> list[PRPRequest]:
+        with self._lock:
+            return super().pop_many(n)
+
+    async def checkpoint(self, requests: Iterable[PRPRequest]) -> None:
+        rows = [(self._codec.encode(r),) for r in requests]
+        self._lock.acquire()
+        try:
+            self._flush()
+            future = self._executor.submit(self._write_snapshot, rows)
+        except BaseException:
+            self._lock.release()
+            raise
+        await asyncio.wrap_future(future)
+
+    def _write_snapshot(self, rows: list[tuple[bytes]]) -> None:
+        try:
+            self._conn.execute("DELETE FROM snapshot")
+            self._conn.executemany("INSERT INTO snapshot (data) VALUES (?)", rows)
+            self._conn.commit()
+        finally:
+            self._lock.release()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self._conn.close()
@@ -0,0 +1,178 @@
+import asyncio
+from typing import Iterable, Iterator
+
+from .buckets import RequestBuckets
+from .spill import SpillStore
+from ..config import QueueConfig
+from ..scheduler import ActivityCounter
+from ..types import PRPRequest
+
+
+class _RequestFrontier:
+    def __init__(self, config: QueueConfig, spill: SpillStore | None) -> None:
+        self._memory_size = config.max_size or None
+        self._buckets = RequestBuckets(order=config.order, interleave_hosts=config.interleave_hosts)
+        self._spill = spill
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._buckets) + (len(self._spill) if self._spill is not None else 0) + self._closed
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def push(self, r: PRPRequest | None) -> None:
+        if r is None:
+            self._closed = True
+        elif self._spill is not None and self._memory_size is not None and len(self._buckets) >= self._memory_size:
+            self._spill.push(r)
+        else:
+            self._buckets.push(r)
+
+    def __iter__(self) -> Iterator[PRPRequest]:
+        return iter(self._buckets)
+
+    def pop(self) -> PRPRequest | None:
+        if self._closed:
+            return None
+
+        spill = self._spill
+        if spill is not None and spill.min_priority is not None:
+            min_priority = self._buckets.min_priority
+            if min_priority is None or spill.min_priority < min_priority:
+                for r in spill.pop_many(max((self._memory_size or 0) - len(self._buckets), 1)):
+                    self._buckets.push(r)
+
+        return self._buckets.pop()
+
+
+class BoundedPriorityQueue:
+    def __init__(
+        self,
+        config: QueueConfig,
+        store: SpillStore | None = None,
+        activity: ActivityCounter | None = None,
+        window: int | None = None,
+    ) -> None:
+        self._config = config
+        self._store = store
+        self._activity = activity
+        self._window = window
+        self._maxsize = 0 if config.spill else config.max_size
+        self._leased: set[int] = set()
+        self._scrapper_activity: dict[str | None, ActivityCounter] = {}
+        self._wakeup = asyncio.Event()
+        self._queue = self._create_frontier()
+        if activity is not None:
+            activity.inc(len(self._queue))
+
+    def _create_frontier(self) -> _RequestFrontier:
+        return _RequestFrontier(self._config, self._store if self._config.spill else None)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def leased(self) -> int:
+        return len(self._leased)
+
+    @property
+    def spilled(self) -> int:
+        return len(self._store) if self._store is not None and self._config.spill else 0
+
+    def get_activity(self, scrapper: str | None) -> ActivityCounter:
+        activity = self._scrapper_activity.get(scrapper)
+        if activity is None:
+            activity = self._scrapper_activity[scrapper] = ActivityCounter()
+        return activity
+
+    def _inc_activity(self, r: PRPRequest) -> None:
+        if self._activity is not None:
+            self._activity.inc()
+        self.get_activity(r.request_params.scrapper).inc()
+
+    def qsize(self) -> int:
+        return len(self._queue)
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= self.qsize()
+
+    def _is_window_full(self) -> bool:
+        return (
+            self._window is not None
+            and len(self._leased) >= self._window
+            and not self.full()
+            and not self._queue.closed
+        )
+
+    def empty(self) -> bool:
+        return not self._queue or self._is_window_full()
+
+    async def _wait(self) -> None:
+        self._wakeup.clear()
+        await self._wakeup.wait()
+
+    async def put(self, item: PRPRequest | None) -> None:
+        while self.full():
+            await self._wait()
+        self.put_nowait(item)
+
+    def put_nowait(self, item: PRPRequest | None) -> None:
+        if self.full():
+            raise asyncio.QueueFull
+        self._put(item)
+        self._wakeup.set()
+
+    def _put(self, item: PRPRequest | None) -> None:
+        self._queue.push(item)
+        if item is not None:
+            self._inc_activity(item)
+
+    async def get(self) -> PRPRequest | None:
+        while self.empty():
+            await self._wait()
+        return self.get_nowait()
+
+    def get_nowait(self) -> PRPRequest | None:
+        if self.empty():
+            raise asyncio.QueueEmpty
+        r = self._get()
+        self._wakeup.set()
+        return r
+
+    def _get(self) -> PRPRequest | None:
+        r = self._queue.pop()
+        if r is not None:
+            self._leased.add(id(r))
+        return r
+
+    def __iter__(self) -> Iterator[PRPRequest]:
+        return iter(self._queue)
+
+    def restore(self, requests: Iterable[PRPRequest]) -> None:
+        for r in requests:
+            self._queue.push(r)
+            self._inc_activity(r)
+        self._wakeup.set()
+
+    def park(self, r: PRPRequest) -> None:
+        if id(r) in self._leased:
+            self._leased.remove(id(r))
+            self._wakeup.set()
+
+    def release(self, r: PRPRequest) -> None:
+        self.park(r)
+
+    async def ack(self, r: PRPRequest) -> None:
+        self.release(r)
+        if self._activity is not None:
+            self._activity.dec()
+        self.get_activity(r.request_params.scrapper).dec()
+
+    async def initialize(self) -> None: ...
+
+    async def close(self) -> None:
+        if self._store is not None:
+            self._store.close()
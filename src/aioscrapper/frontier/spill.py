@@ -0,0 +1,68 @@
+import os
+import sqlite3
+import tempfile
+
+from ..serialization import RequestCodec
+from ..types import PRPRequest
+
+
+class SpillStore:
+    def __init__(self, codec: RequestCodec, path: str | None = None, batch_size: int = 1000) -> None:
+        self._codec = codec
+        self._batch_size = batch_size
+        self._temporary = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="aioscrapper-", suffix=".sqlite")
+            os.close(fd)
+        self._path = path
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._setup()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS requests "
+            "(id INTEGER PRIMARY KEY, priority INTEGER NOT NULL, data BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS requests_priority ON requests (priority, id)")
+        self._buffer: list[tuple[int, bytes]] = []
+        self._size = self._conn.execute("SELECT COUNT(*) FROM requests").fetchone()[0]
+        self._min_priority: int | None = self._conn.execute("SELECT MIN(priority) FROM requests").fetchone()[0]
+
+    def _setup(self) -> None:
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def min_priority(self) -> int | None:
+        return self._min_priority
+
+    def push(self, r: PRPRequest) -> None:
+        self._buffer.append((r.priority, self._codec.encode(r)))
+        self._size += 1
+        if self._min_priority is None or r.priority < self._min_priority:
+            self._min_priority = r.priority
+        if len(self._buffer) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        self._flush()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._conn.executemany("INSERT INTO requests (priority, data) VALUES (?, ?)", self._buffer)
+            self._buffer.clear()
+
+    def pop_many(self, n: int) -> list[PRPRequest]:
+        self._flush()
+        rows = self._conn.execute("SELECT id, data FROM requests ORDER BY priority, id LIMIT ?", (n,)).fetchall()
+        self._conn.executemany("DELETE FROM requests WHERE id = ?", ((row[0],) for row in rows))
+        self._size -= len(rows)
+        self._min_priority = self._conn.execute("SELECT MIN(priority) FROM requests").fetchone()[0]
+        return [self._codec.decode(row[1]) for row in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+        if self._temporary:
+            os.remove(self._path)
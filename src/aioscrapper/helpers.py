@@ -1,5 +1,49 @@
 import inspect
+import time
+import weakref
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from types import MethodType
 from typing import Callable, Awaitable, Any
+from urllib.parse import urlencode
+
+from .types import Request
+
+
+@dataclass(slots=True, frozen=True)
+class CallbackPlan:
+    names: tuple[str, ...]
+    var_kwargs: bool
+
+
+_function_plans: "weakref.WeakKeyDictionary[Callable, CallbackPlan]" = weakref.WeakKeyDictionary()
+_method_plans: "weakref.WeakKeyDictionary[Callable, CallbackPlan]" = weakref.WeakKeyDictionary()
+
+
+def _build_callback_plan(callback: Callable[..., Awaitable]) -> CallbackPlan:
+    names, var_kwargs = [], False
+    for param in inspect.signature(callback).parameters.values():
+        if param.kind is inspect.Parameter.VAR_KEYWORD:
+            var_kwargs = True
+        elif param.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):
+            names.append(param.name)
+    return CallbackPlan(names=tuple(names), var_kwargs=var_kwargs)
+
+
+def get_callback_plan(callback: Callable[..., Awaitable]) -> CallbackPlan:
+    if isinstance(callback, MethodType):
+        plans, key = _method_plans, callback.__func__
+    else:
+        plans, key = _function_plans, callback
+
+    try:
+        plan = plans.get(key)
+    except TypeError:
+        return _build_callback_plan(callback)
+
+    if plan is None:
+        plan = plans[key] = _build_callback_plan(callback)
+    return plan
 
 
 def get_cb_kwargs(
@@ -10,10 +54,32 @@ def get_cb_kwargs(
     if cb_kwargs is None and srv_kwargs is None:
         return {}
 
-    if cb_kwargs is None:
-        cb_kwargs = {}
-    if srv_kwargs is None:
-        srv_kwargs = {}
+    plan = get_callback_plan(callback)
+    if plan.var_kwargs and cb_kwargs:
+        kwargs = dict(cb_kwargs)
+    else:
+        kwargs = {name: cb_kwargs[name] for name in plan.names if name in cb_kwargs} if cb_kwargs else {}
+
+    if srv_kwargs:
+        for name in plan.names:
+            if name in srv_kwargs:
+                kwargs[name] = srv_kwargs[name]
+    return kwargs
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
 
-    kwargs = cb_kwargs | srv_kwargs
-    return {param: kwargs[param] for param in inspect.signature(callback).parameters.keys() if param in kwargs}
+def get_full_url(request: Request) -> str:
+    return f"{request.url}{urlencode(request.params or {})}"
@@ -0,0 +1,105 @@
+import asyncio
+import importlib
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+from .config import OffloadConfig
+from .types import Response, CIHeaders
+
+
+class FollowRequest:
+    __slots__ = ("url", "kwargs")
+
+    def __init__(self, url: str, **kwargs: Any) -> None:
+        self.url = url
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.url!r}, **{self.kwargs!r})"
+
+
+class OffloadCallback:
+    def __init__(self, func: Callable[..., Iterable[Any] | None], owner: Any = None) -> None:
+        if isinstance(func, staticmethod):
+            func = func.__func__
+        self.func = func
+        self.owner = owner
+
+    def __get__(self, instance: Any, owner: type | None = None) -> "OffloadCallback":
+        return self if instance is None else OffloadCallback(self.func, instance)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Iterable[Any] | None:
+        return self.func(*args, **kwargs)
+
+    def __reduce__(self) -> tuple[Callable, tuple[Any, ...]]:
+        return _load_callback, (self.ref, self.owner)
+
+    @property
+    def ref(self) -> tuple[str, str]:
+        return self.func.__module__, self.func.__qualname__
+
+
+def offload(func: Callable[..., Iterable[Any] | None]) -> OffloadCallback:
+    return OffloadCallback(func)
+
+
+def _load_callback(ref: tuple[str, str], owner: Any = None) -> OffloadCallback:
+    module, qualname = ref
+    obj: Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = vars(obj)[name] if isinstance(obj, type) else getattr(obj, name)
+    callback = obj if isinstance(obj, OffloadCallback) else OffloadCallback(obj)
+    return callback.__get__(owner) if owner is not None else callback
+
+
+def _run(func: Callable[..., Iterable[Any] | None], response: Response, kwargs: dict[str, Any]) -> list[Any]:
+    return list(func(response, **kwargs) or ())
+
+
+def _run_ref(ref: tuple[str, str], response: Response, kwargs: dict[str, Any]) -> list[Any]:
+    return _run(_load_callback(ref).func, response, kwargs)
+
+
+def detach_response(response: Response) -> Response:
+    return Response(
+        url=response.url,
+        method=response.method,
+        params=response.params,
+        status=response.status,
+        headers=CIHeaders((response.headers or {}).items()),
+        cookies=dict(response.cookies or {}),
+        content=response.bytes(),
+        content_type=response.content_type,
+    )
+
+
+class OffloadExecutor:
+    def __init__(self, config: OffloadConfig) -> None:
+        self._config = config
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._config.executor == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self._config.max_workers)
+            elif self._config.executor == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self._config.max_workers)
+            else:
+                raise RuntimeError(f"Unknown offload executor: {self._config.executor}")
+        return self._executor
+
+    async def run(self, callback: OffloadCallback, response: Response, kwargs: dict[str, Any]) -> list[Any]:
+        loop = asyncio.get_running_loop()
+        if self._config.executor == "thread":
+            return await loop.run_in_executor(self._get_executor(), _run, callback.func, response, kwargs)
+        return await loop.run_in_executor(
+            self._get_executor(),
+            _run_ref,
+            callback.ref,
+            detach_response(response),
+            kwargs,
+        )
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
@@ -1,2 +1,3 @@
 from .base import BasePipeline
+from .batch import BatchPipeline
 from .dispatcher import Pipeline
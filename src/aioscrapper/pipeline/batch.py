@@ -0,0 +1,59 @@
+import asyncio
+from abc import abstractmethod
+from logging import Logger, getLogger
+
+from .base import BasePipeline, PipelineItem
+
+
+class BatchPipeline(BasePipeline[PipelineItem]):
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        flush_interval: float | None = 1.0,
+        logger: Logger | None = None,
+    ) -> None:
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._logger = logger or getLogger("aioscrapper.pipeline")
+        self._buffer: list[PipelineItem] = []
+        self._flush_task: asyncio.Task | None = None
+        self._closing = asyncio.Event()
+
+    @abstractmethod
+    async def put_items(self, items: list[PipelineItem]) -> None: ...
+
+    async def put_item(self, item: PipelineItem) -> None:
+        self._buffer.append(item)
+        if len(self._buffer) >= self._batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._buffer:
+            return
+
+        items, self._buffer = self._buffer, []
+        await self.put_items(items)
+
+    async def _flush_periodically(self, interval: float) -> None:
+        while not self._closing.is_set():
+            try:
+                await asyncio.wait_for(self._closing.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                return
+
+            try:
+                await self.flush()
+            except Exception:
+                self._logger.exception(f"{self.__class__.__name__} failed to flush items")
+
+    async def initialize(self) -> None:
+        if self._flush_interval is not None:
+            self._flush_task = asyncio.create_task(self._flush_periodically(self._flush_interval))
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._flush_task is not None:
+            await self._flush_task
+        await self.flush()
@@ -1,13 +1,34 @@
+import asyncio
+import time
 from logging import Logger
 from typing import Generator
 
 from .base import BasePipeline, BaseItem
+from ..config import PipelineConfig
+from ..scheduler import ActivityCounter
+from ..stats import StatsCollector
 
 
 class Pipeline:
-    def __init__(self, logger: Logger, pipelines: dict[str, list[BasePipeline]] | None = None) -> None:
+    def __init__(
+        self,
+        logger: Logger,
+        pipelines: dict[str, list[BasePipeline]] | None = None,
+        config: PipelineConfig | None = None,
+        stats: StatsCollector | None = None,
+        activity: ActivityCounter | None = None,
+    ) -> None:
         self._logger = logger
         self._pipelines = pipelines or {}
+        self._config = config or PipelineConfig()
+        self._stats = stats
+        self._activity = activity
+        self._queues: dict[int, asyncio.Queue] = {}
+        self._workers: list[asyncio.Task] = []
+        self._pending = 0
+
+    def __len__(self) -> int:
+        return self._pending
 
     async def put_item(self, item: BaseItem) -> None:
         self._logger.debug(f"pipeline item received: {item}")
@@ -16,8 +37,54 @@ class Pipeline:
         except KeyError:
             raise RuntimeError(f"Pipelines for item {item} not found")
 
+        if self._stats is not None:
+            self._stats.inc("items")
+        if not self._queues:
+            for pipeline in pipelines:
+                await self._process_item(pipeline, item)
+            return
+
         for pipeline in pipelines:
+            self._add_pending(1)
+            try:
+                await self._queues[id(pipeline)].put(item)
+            except BaseException:
+                self._add_pending(-1)
+                raise
+
+    def _add_pending(self, value: int) -> None:
+        self._pending += value
+        if self._activity is None:
+            return
+        if value > 0:
+            self._activity.inc(value)
+        else:
+            self._activity.dec(-value)
+
+    async def _process_item(self, pipeline: BasePipeline, item: BaseItem) -> None:
+        if self._stats is None:
+            await pipeline.put_item(item)
+            return
+
+        start_time = time.monotonic()
+        try:
             await pipeline.put_item(item)
+        except Exception:
+            self._stats.inc("pipeline_errors")
+            raise
+        finally:
+            self._stats.observe("pipeline", time.monotonic() - start_time)
+
+    async def _listen_queue(self, pipeline: BasePipeline, queue: asyncio.Queue) -> None:
+        while True:
+            item = await queue.get()
+            try:
+                await self._process_item(pipeline, item)
+            except Exception:
+                self._logger.exception(f"{pipeline.__class__.__name__} failed to process item: {item}")
+            finally:
+                self._add_pending(-1)
+                queue.task_done()
 
     def _get_pipelines(self) -> Generator[BasePipeline, None, None]:
         for pipelines in self._pipelines.values():
@@ -28,6 +95,22 @@ class Pipeline:
         for pipeline in self._get_pipelines():
             await pipeline.initialize()
 
+        if self._config.queue_size is None:
+            return
+
+        for pipeline in self._get_pipelines():
+            if id(pipeline) in self._queues:
+                continue
+
+            queue = self._queues[id(pipeline)] = asyncio.Queue(maxsize=self._config.queue_size)
+            for _ in range(self._config.workers):
+                self._workers.append(asyncio.create_task(self._listen_queue(pipeline, queue)))
+
     async def close(self) -> None:
+        for queue in self._queues.values():
+            await queue.join()
+        for worker in self._workers:
+            worker.cancel()
+
         for pipeline in self._get_pipelines():
             await pipeline.close()
@@ -1,12 +1,54 @@
 import asyncio
-from typing import Callable, Awaitable, Any
+import time
+from contextvars import ContextVar
+from dataclasses import replace
+from typing import Callable, Awaitable, Any, Iterable, AsyncIterable
 
-from .types import QueryParams, Cookies, Headers, BasicAuth, Request, RequestParams, RequestQueue, PRPRequest
+from .config import RetryConfig
+from .dupefilter import BaseDupeFilter, get_request_fingerprint
+from .frontier import BoundedPriorityQueue
+from .scheduler import ActivityCounter
+from .types import QueryParams, Cookies, Headers, BasicAuth, Request, RequestParams, PRPRequest
+
+SendItem = str | tuple[str, dict[str, Any]]
+
+request_depth: ContextVar[int] = ContextVar("request_depth", default=-1)
 
 
 class RequestSender:
-    def __init__(self, queue: RequestQueue) -> None:
+    def __init__(
+        self,
+        queue: BoundedPriorityQueue,
+        dupefilter: BaseDupeFilter | None = None,
+        digest_size: int = 8,
+        activity: ActivityCounter | None = None,
+        max_depth: int | None = None,
+        scrapper: str | None = None,
+    ) -> None:
         self._queue = queue
+        self._dupefilter = dupefilter
+        self._digest_size = digest_size
+        self._activity = activity
+        self._max_depth = max_depth
+        self._scrapper = scrapper
+
+    @property
+    def scrapper(self) -> str | None:
+        return self._scrapper
+
+    async def _put(self, request: Request, request_params: RequestParams, priority: int, dont_filter: bool) -> bool:
+        if self._max_depth is not None and request_params.depth > self._max_depth:
+            return False
+
+        if (
+            self._dupefilter is not None
+            and not dont_filter
+            and not self._dupefilter.add(get_request_fingerprint(request, self._digest_size))
+        ):
+            return False
+
+        await self._queue.put(PRPRequest(priority=priority, request=request, request_params=request_params))
+        return True
 
     async def __call__(
         self,
@@ -25,28 +67,116 @@ class RequestSender:
         timeout: float | None = None,
         priority: int = 0,
         delay: float | None = None,
+        retry: RetryConfig | None = None,
+        dont_filter: bool = False,
+        stream: bool = False,
+        max_body_size: int | None = None,
+        deadline: float | None = None,
     ) -> None:
-        await self._queue.put(
-            PRPRequest(
-                priority=priority,
-                request=Request(
-                    method=method,
+        request = Request(
+            method=method,
+            url=url,
+            params=params,
+            data=data,
+            json_data=json_data,
+            cookies=cookies,
+            headers=headers,
+            auth=auth,
+            proxy=proxy,
+            timeout=timeout,
+            stream=stream,
+            max_body_size=max_body_size,
+        )
+        request_params = RequestParams(
+            callback=callback,
+            cb_kwargs=cb_kwargs,
+            errback=errback,
+            retry=retry,
+            dont_filter=dont_filter,
+            depth=request_depth.get() + 1,
+            scrapper=self._scrapper,
+            deadline=time.time() + deadline if deadline is not None else None,
+        )
+        if await self._put(request, request_params, priority, dont_filter) and delay:
+            await asyncio.sleep(delay)
+
+    async def send_many(
+        self,
+        items: Iterable[SendItem] | AsyncIterable[SendItem],
+        method: str = "GET",
+        callback: Callable[..., Awaitable] | None = None,
+        cb_kwargs: dict[str, Any] | None = None,
+        errback: Callable[..., Awaitable] | None = None,
+        params: QueryParams | None = None,
+        cookies: Cookies | None = None,
+        headers: Headers | None = None,
+        proxy: str | None = None,
+        auth: BasicAuth | None = None,
+        timeout: float | None = None,
+        priority: int = 0,
+        retry: RetryConfig | None = None,
+        dont_filter: bool = False,
+        stream: bool = False,
+        max_body_size: int | None = None,
+        deadline: float | None = None,
+        window: int = 1000,
+    ) -> int:
+        request_params = RequestParams(
+            callback=callback,
+            cb_kwargs=cb_kwargs,
+            errback=errback,
+            retry=retry,
+            dont_filter=dont_filter,
+            depth=request_depth.get() + 1,
+            scrapper=self._scrapper,
+        )
+        outstanding = self._queue.get_activity(self._scrapper)
+        if self._activity is not None:
+            self._activity.inc()
+        try:
+            count = 0
+            async for item in _iter_items(items):
+                if len(outstanding) >= window:
+                    await outstanding.wait_below(window)
+
+                if isinstance(item, str):
+                    url, item_params = item, request_params
+                else:
+                    url, item_cb_kwargs = item
+                    item_params = RequestParams(
+                        callback=callback,
+                        cb_kwargs={**cb_kwargs, **item_cb_kwargs} if cb_kwargs else item_cb_kwargs,
+                        errback=errback,
+                        retry=retry,
+                        dont_filter=dont_filter,
+                        depth=request_params.depth,
+                        scrapper=self._scrapper,
+                    )
+                if deadline is not None:
+                    item_params = replace(item_params, deadline=time.time() + deadline)
+                request = Request(
                     url=url,
+                    method=method,
                     params=params,
-                    data=data,
-                    json_data=json_data,
                     cookies=cookies,
                     headers=headers,
                     auth=auth,
                     proxy=proxy,
                     timeout=timeout,
-                ),
-                request_params=RequestParams(
-                    callback=callback,
-                    cb_kwargs=cb_kwargs,
-                    errback=errback,
-                ),
-            )
-        )
-        if delay:
-            await asyncio.sleep(delay)
+                    stream=stream,
+                    max_body_size=max_body_size,
+                )
+                count += await self._put(request, item_params, priority, dont_filter)
+            return count
+        finally:
+            if self._activity is not None:
+                self._activity.dec()
+
+
+async def _iter_items(items: Iterable[SendItem] | AsyncIterable[SendItem]) -> AsyncIterable[SendItem]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
@@ -1,14 +1,23 @@
 import asyncio
+import itertools
+import time
+from dataclasses import replace
 from logging import Logger
-from typing import Callable, Awaitable, Any, Coroutine
-from urllib.parse import urlencode
+from typing import Callable, Awaitable, Any, Coroutine, Iterator
 
-from .exceptions import HTTPException, RequestException
-from .helpers import get_cb_kwargs
+from .config import RetryConfig
+from .exceptions import HTTPException, RequestException, DeadlineExceededException, ResponseTooLargeException
+from .frontier import BoundedPriorityQueue
+from .helpers import get_cb_kwargs, get_full_url
 from .middleware import RequestOuterMiddleware, RequestInnerMiddleware, ResponseMiddleware
-from .request_sender import RequestSender
+from .offload import OffloadExecutor, OffloadCallback, FollowRequest
+from .request_sender import RequestSender, request_depth
+from .retry import get_retry_delay
+from .robots import RobotsManager, RobotsRules
+from .scheduler import HostScheduler, AutoThrottle, DelayQueue, HedgePolicy, get_host
 from .session.base import BaseSession
-from .types import Request, RequestParams, RequestQueue
+from .stats import StatsCollector
+from .types import PRPRequest, Request, RequestParams, Response
 
 
 class RequestWorker:
@@ -17,11 +26,21 @@ class RequestWorker:
         logger: Logger,
         session: BaseSession,
         schedule_request: Callable[[Coroutine], Awaitable],
+        schedule_processing: Callable[[Coroutine], Awaitable],
         sender: RequestSender,
-        queue: RequestQueue,
+        queue: BoundedPriorityQueue,
+        host_scheduler: HostScheduler,
         delay: float,
         shutdown_timeout: float,
         srv_kwargs: dict[str, Any],
+        retry: RetryConfig,
+        offload_executor: OffloadExecutor,
+        response_buffer: int = 0,
+        senders: list[RequestSender] | None = None,
+        autothrottle: AutoThrottle | None = None,
+        hedge: HedgePolicy | None = None,
+        robots: RobotsManager | None = None,
+        stats: StatsCollector | None = None,
         request_outer_middlewares: list[RequestOuterMiddleware] | None = None,
         request_inner_middlewares: list[RequestInnerMiddleware] | None = None,
         response_middlewares: list[ResponseMiddleware] | None = None,
@@ -29,71 +48,390 @@ class RequestWorker:
         self._logger = logger
         self._session = session
         self._schedule_request = schedule_request
+        self._schedule_processing = schedule_processing
         self._queue = queue
+        self._host_scheduler = host_scheduler
         self._delay = delay
         self._shutdown_timeout = shutdown_timeout
         self._srv_kwargs = {"send_request": sender, **srv_kwargs}
+        self._scrapper_srv_kwargs = {s.scrapper: {**self._srv_kwargs, "send_request": s} for s in senders or ()}
+        self._retry = retry
+        self._offload_executor = offload_executor
+        self._delay_queue = DelayQueue()
+        self._responses: asyncio.Queue[tuple[PRPRequest, Response] | None] = asyncio.Queue(response_buffer)
+        self._autothrottle = autothrottle
+        self._hedge = hedge
+        self._robots = robots
+        self._stats = stats
         self._request_outer_middlewares = request_outer_middlewares or []
         self._request_inner_middlewares = request_inner_middlewares or []
         self._response_middlewares = response_middlewares or []
         self._task: asyncio.Task | None = None
+        self._dispatch_task: asyncio.Task | None = None
+        self._delayed_task: asyncio.Task | None = None
+        self._responses_task: asyncio.Task | None = None
+        self._in_flight: dict[int, PRPRequest] = {}
+        self._processing: dict[int, PRPRequest] = {}
+        self._robots_pending: dict[int, PRPRequest] = {}
+        self._robots_tasks: set[asyncio.Task] = set()
 
-    async def _send_request(self, request: Request, params: RequestParams) -> None:
+    def __len__(self) -> int:
+        return len(self._host_scheduler) + len(self._delay_queue)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    @property
+    def delayed(self) -> int:
+        return len(self._delay_queue)
+
+    @property
+    def buffered(self) -> int:
+        return self._responses.qsize()
+
+    @property
+    def processing(self) -> int:
+        return len(self._processing)
+
+    @property
+    def robots_pending(self) -> int:
+        return len(self._robots_pending)
+
+    def get_pending_requests(self) -> Iterator[PRPRequest]:
+        return itertools.chain(
+            self._in_flight.values(),
+            self._processing.values(),
+            self._robots_pending.values(),
+            self._host_scheduler,
+            self._delay_queue,
+        )
+
+    async def _send_request(self, r: PRPRequest) -> bool:
+        request, params = r.request, r.request_params
         for inner_middleware in self._request_inner_middlewares:
             await inner_middleware(request, params)
 
-        full_url = f"{request.url}{urlencode(request.params or {})}"
-        self._logger.debug(f"request: {request.method} {full_url}")
+        self._logger.debug(f"request: {request.method} {get_full_url(request)}")
+        if self._stats is not None:
+            self._stats.inc("requests")
+            if params.scrapper is not None:
+                self._stats.inc_scrapper(params.scrapper, "requests")
+
+        start_time = time.monotonic()
+        if request.stream and not _is_expired(params):
+            async with self._session.stream_request(request) as response:
+                if self._on_response(r, response, latency=time.monotonic() - start_time):
+                    return True
+                self._queue.release(r)
+                await self._handle_response(r, response)
+                return False
+
+        response = await self._make_request(r)
+        if not self._on_response(r, response, latency=time.monotonic() - start_time):
+            await self._buffer_response(r, response)
+        return True
+
+    async def _make_request(self, r: PRPRequest) -> Response:
+        request, params = r.request, r.request_params
+        hedge_delay = self._hedge.get_delay(request) if self._hedge is not None else None
+        if params.deadline is None and hedge_delay is None:
+            return await self._session.make_request(request)
+        if _is_expired(params):
+            return _get_expired_response(request, params)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + params.deadline - time.time() if params.deadline is not None else None
+        next_hedge = loop.time() + hedge_delay if hedge_delay is not None else None
+        first = asyncio.create_task(self._session.make_request(request))
+        pending, hedges = {first}, 0
+        try:
+            while True:
+                now = loop.time()
+                timeouts = [t - now for t in (deadline, next_hedge) if t is not None]
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=min(timeouts) if timeouts else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    response = task.result()
+                    if response.exception is None or not pending:
+                        if task is not first and self._stats is not None:
+                            self._stats.inc("hedge_wins")
+                        return response
+
+                now = loop.time()
+                if deadline is not None and now >= deadline:
+                    return _get_expired_response(request, params)
+                if next_hedge is not None and now >= next_hedge:
+                    self._logger.debug(f"hedge #{hedges + 1}: {request.method} {get_full_url(request)}")
+                    pending.add(asyncio.create_task(self._session.make_request(request)))
+                    hedges += 1
+                    next_hedge = now + hedge_delay if hedges < self._hedge.max_hedges else None
+                    if self._stats is not None:
+                        self._stats.inc("hedges")
+        finally:
+            for task in pending:
+                task.cancel()
 
-        response = await self._session.make_request(request)
+    def _on_response(self, r: PRPRequest, response: Response, latency: float) -> bool:
+        request, params = r.request, r.request_params
+        if self._stats is not None:
+            if response.exception is not None:
+                self._stats.observe_error(response.exception)
+            else:
+                self._stats.observe_response(get_host(request.url), response.status, latency)
+            if params.scrapper is not None:
+                self._stats.inc_scrapper(
+                    params.scrapper,
+                    "request_errors" if response.exception is not None else "responses",
+                )
+        if self._autothrottle is not None:
+            self._autothrottle.observe(
+                self._host_scheduler.get_slot(get_host(request.url)),
+                latency=latency,
+                response=response,
+            )
+        if self._hedge is not None and response.exception is None:
+            self._hedge.observe(get_host(request.url), latency)
+
+        retry_delay = get_retry_delay(params.retry or self._retry, response, params.attempt)
+        if retry_delay is not None and (params.deadline is None or time.time() + retry_delay < params.deadline):
+            self._logger.debug(
+                f"retry #{params.attempt + 1} in {retry_delay:.2f}s: {request.method} {get_full_url(request)}"
+            )
+            r.request_params = replace(params, attempt=params.attempt + 1)
+            if self._stats is not None:
+                self._stats.inc("retries")
+            self._queue.park(r)
+            self._delay_queue.put(r, retry_delay)
+            return True
+        return False
+
+    async def _buffer_response(self, r: PRPRequest, response: Response) -> None:
+        self._queue.release(r)
+        self._processing[id(r)] = r
+        await self._responses.put((r, response))
+
+    async def _handle_response(self, r: PRPRequest, response: Response) -> None:
+        params = r.request_params
         for response_middleware in self._response_middlewares:
             await response_middleware(params, response)
 
         if response.exception is not None:
             output_exc = RequestException(
                 inner_exc=response.exception,
-                url=full_url,
+                url=get_full_url(r.request),
                 method=response.method,
             )
         elif response.status is not None and response.status >= 400:
             output_exc = HTTPException(
                 status_code=response.status,
-                message=response.text(),
-                url=full_url,
+                message=None,
+                url=get_full_url(r.request),
                 method=response.method,
+                response=response,
             )
         else:
             output_exc = None
 
-        if output_exc is not None:
+        if output_exc is not None and params.errback is None:
+            raise output_exc
+
+        request_depth.set(params.depth)
+        srv_kwargs = self._scrapper_srv_kwargs.get(params.scrapper, self._srv_kwargs)
+        start_time = time.monotonic()
+        try:
+            if output_exc is None and response.status is not None:
+                output_exc = await self._run_callback(r, response, srv_kwargs)
+            if output_exc is not None:
+                await params.errback(
+                    output_exc,
+                    **get_cb_kwargs(params.errback, srv_kwargs=srv_kwargs, cb_kwargs=params.cb_kwargs),
+                )
+        except Exception:
+            if self._stats is not None:
+                self._stats.inc("callback_errors")
+                if params.scrapper is not None:
+                    self._stats.inc_scrapper(params.scrapper, "callback_errors")
+            raise
+        finally:
+            if self._stats is not None:
+                self._stats.observe("callback", time.monotonic() - start_time)
+
+    async def _run_callback(
+        self,
+        r: PRPRequest,
+        response: Response,
+        srv_kwargs: dict[str, Any],
+    ) -> RequestException | None:
+        params = r.request_params
+        try:
+            if isinstance(params.callback, OffloadCallback):
+                await self._run_offloaded(params.callback, response, params, srv_kwargs)
+            elif params.callback is not None:
+                await params.callback(
+                    response,
+                    **get_cb_kwargs(params.callback, srv_kwargs=srv_kwargs, cb_kwargs=params.cb_kwargs),
+                )
+        except ResponseTooLargeException as exc:
+            if not r.request.stream:
+                raise
+
+            if self._stats is not None:
+                self._stats.inc("responses_too_large")
+            output_exc = RequestException(inner_exc=exc, url=get_full_url(r.request), method=response.method)
             if params.errback is None:
-                raise output_exc
+                raise output_exc from exc
+            return output_exc
+        return None
 
-            await params.errback(
-                output_exc,
-                **get_cb_kwargs(params.errback, srv_kwargs=self._srv_kwargs, cb_kwargs=params.cb_kwargs),
-            )
-        elif response.status is not None and params.callback is not None:
-            await params.callback(
-                response,
-                **get_cb_kwargs(params.callback, srv_kwargs=self._srv_kwargs, cb_kwargs=params.cb_kwargs),
-            )
+    async def _run_offloaded(
+        self,
+        callback: OffloadCallback,
+        response: Response,
+        params: RequestParams,
+        srv_kwargs: dict[str, Any],
+    ) -> None:
+        if response.is_stream:
+            await response.read()
+
+        results = await self._offload_executor.run(
+            callback,
+            response,
+            get_cb_kwargs(callback.func, srv_kwargs=None, cb_kwargs=params.cb_kwargs),
+        )
+        for result in results:
+            if isinstance(result, FollowRequest):
+                kwargs = result.kwargs
+                for name in ("callback", "errback"):
+                    value = kwargs.get(name)
+                    if isinstance(value, str):
+                        if callback.owner is None:
+                            raise RuntimeError(f"Cannot resolve {name} {value!r} of {callback.func.__qualname__}")
+                        kwargs[name] = getattr(callback.owner, value)
+                    elif isinstance(value, OffloadCallback) and value.owner is None:
+                        kwargs[name] = value.__get__(callback.owner)
+                await srv_kwargs["send_request"](result.url, **kwargs)
+            elif result is not None:
+                await srv_kwargs["pipeline"].put_item(result)
+
+    async def _process_request(self, r: PRPRequest) -> None:
+        handed_off = False
+        try:
+            handed_off = await self._send_request(r)
+        finally:
+            self._in_flight.pop(id(r), None)
+            self._host_scheduler.release(get_host(r.request.url))
+            if not handed_off:
+                await self._queue.ack(r)
+
+    async def _process_response(self, r: PRPRequest, response: Response) -> None:
+        try:
+            await self._handle_response(r, response)
+        finally:
+            self._processing.pop(id(r), None)
+            await self._queue.ack(r)
 
     def listen_queue(self) -> None:
         self._task = asyncio.create_task(self._listen_queue())
+        self._dispatch_task = asyncio.create_task(self._dispatch())
+        self._delayed_task = asyncio.create_task(self._listen_delayed())
+        self._responses_task = asyncio.create_task(self._listen_responses())
 
     async def _listen_queue(self) -> None:
         while (r := (await self._queue.get())) is not None:
             for outer_middleware in self._request_outer_middlewares:
                 await outer_middleware(r.request, r.request_params)
 
-            await self._schedule_request(self._send_request(r.request, r.request_params))
+            if self._robots is not None:
+                rules = self._robots.get(r.request.url)
+                if rules is None:
+                    self._wait_robots(r)
+                    continue
+                if not await self._check_robots(r, rules):
+                    continue
+
+            await self._enqueue(r)
+
+    async def _enqueue(self, r: PRPRequest) -> None:
+        if (response := await self._session.get_cached_response(r.request)) is not None:
+            await self._buffer_response(r, response)
+        elif not self._host_scheduler.put(r):
+            self._queue.park(r)
+
+    async def _check_robots(self, r: PRPRequest, rules: RobotsRules) -> bool:
+        if rules.allowed(r.request.url):
+            return True
+
+        self._logger.debug(f"forbidden by robots.txt: {r.request.method} {get_full_url(r.request)}")
+        if self._stats is not None:
+            self._stats.inc("robots_forbidden")
+        await self._queue.ack(r)
+        return False
+
+    def _wait_robots(self, r: PRPRequest) -> None:
+        self._queue.park(r)
+        self._robots_pending[id(r)] = r
+        task = asyncio.create_task(self._load_robots(r))
+        self._robots_tasks.add(task)
+        task.add_done_callback(self._robots_tasks.discard)
+
+    async def _load_robots(self, r: PRPRequest) -> None:
+        try:
+            rules = await self._robots.load(r.request.url)
+        finally:
+            self._robots_pending.pop(id(r), None)
+        if await self._check_robots(r, rules):
+            await self._enqueue(r)
+
+    async def _listen_delayed(self) -> None:
+        while (r := (await self._delay_queue.get())) is not None:
+            self._host_scheduler.put(r)
+
+    async def _listen_responses(self) -> None:
+        while (item := (await self._responses.get())) is not None:
+            await self._schedule_processing(self._process_response(*item))
+
+    async def _dispatch(self) -> None:
+        while (r := (await self._host_scheduler.get())) is not None:
+            self._in_flight[id(r)] = r
+            await self._schedule_request(self._process_request(r))
             await asyncio.sleep(self._delay)
 
+    async def _wait_task(self, task: asyncio.Task | None, force: bool) -> None:
+        if task is not None:
+            await asyncio.wait_for(task, timeout=self._shutdown_timeout) if force else await task
+
     async def shutdown(self, force: bool = False) -> None:
         await self._queue.put(None)
-        if self._task is not None:
-            await asyncio.wait_for(self._task, timeout=self._shutdown_timeout) if force else await self._task
+        await self._wait_task(self._task, force)
+
+        self._delay_queue.close()
+        await self._wait_task(self._delayed_task, force)
+
+        self._host_scheduler.close()
+        await self._wait_task(self._dispatch_task, force)
 
     async def close(self) -> None:
+        for task in self._robots_tasks:
+            task.cancel()
+        if self._responses_task is not None:
+            self._responses_task.cancel()
+            await asyncio.gather(self._responses_task, return_exceptions=True)
         await self._session.close()
+        self._offload_executor.close()
+
+
+def _is_expired(params: RequestParams) -> bool:
+    return params.deadline is not None and time.time() >= params.deadline
+
+
+def _get_expired_response(request: Request, params: RequestParams) -> Response:
+    return Response(
+        url=request.url,
+        method=request.method,
+        params=request.params,
+        exception=DeadlineExceededException(params.deadline, url=get_full_url(request), method=request.method),
+    )
@@ -0,0 +1,30 @@
+import random
+
+from .config import RetryConfig
+from .exceptions import DeadlineExceededException, ResponseTooLargeException
+from .helpers import parse_retry_after
+from .types import Response
+
+_NON_RETRYABLE_EXCEPTIONS = (ResponseTooLargeException, DeadlineExceededException)
+
+
+def get_retry_delay(config: RetryConfig, response: Response, attempt: int) -> float | None:
+    if attempt + 1 >= config.max_attempts:
+        return None
+
+    if (exc := response.exception) is not None:
+        if isinstance(exc, _NON_RETRYABLE_EXCEPTIONS) or not isinstance(exc, config.exceptions):
+            return None
+    elif response.status not in config.statuses:
+        return None
+
+    delay = min(config.backoff_base * 2**attempt, config.backoff_max)
+    if config.jitter:
+        delay = random.uniform(0, delay)
+
+    if config.respect_retry_after and response.headers is not None:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+    return delay
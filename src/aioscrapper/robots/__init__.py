@@ -0,0 +1,2 @@
+from .manager import RobotsManager, get_origin
+from .rules import RobotsRules, parse_robots
@@ -0,0 +1,101 @@
+import asyncio
+import time
+from collections import OrderedDict
+from logging import Logger
+from urllib.parse import urlsplit
+
+from .rules import RobotsRules, parse_robots
+from ..config import RobotsConfig
+from ..scheduler import HostScheduler
+from ..session.base import BaseSession
+from ..stats import StatsCollector
+from ..types import Request
+
+
+def get_origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class RobotsManager:
+    def __init__(
+        self,
+        session: BaseSession,
+        config: RobotsConfig,
+        logger: Logger,
+        host_scheduler: HostScheduler | None = None,
+        stats: StatsCollector | None = None,
+    ) -> None:
+        self._session = session
+        self._config = config
+        self._logger = logger
+        self._host_scheduler = host_scheduler
+        self._stats = stats
+        self._cache: OrderedDict[str, tuple[float, RobotsRules]] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[RobotsRules]] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, url: str) -> RobotsRules | None:
+        origin = get_origin(url)
+        item = self._cache.get(origin)
+        if item is None:
+            return None
+
+        expires, rules = item
+        if expires <= time.monotonic():
+            del self._cache[origin]
+            return None
+
+        self._cache.move_to_end(origin)
+        if rules.delay and self._host_scheduler is not None:
+            host = urlsplit(origin).hostname or ""
+            if host not in self._host_scheduler.slots:
+                self._apply_delay(host, rules)
+        return rules
+
+    async def load(self, url: str) -> RobotsRules:
+        if (rules := self.get(url)) is not None:
+            return rules
+
+        origin = get_origin(url)
+        future = self._pending.get(origin)
+        if future is None:
+            future = self._pending[origin] = asyncio.ensure_future(self._fetch(origin))
+            future.add_done_callback(lambda _: self._pending.pop(origin, None))
+        return await asyncio.shield(future)
+
+    async def _fetch(self, origin: str) -> RobotsRules:
+        response = await self._session.make_request(
+            Request(
+                url=f"{origin}/robots.txt",
+                method="GET",
+                headers={"User-Agent": self._config.user_agent} if self._config.user_agent != "*" else None,
+                timeout=self._config.timeout,
+                max_body_size=self._config.max_size,
+            )
+        )
+        if self._stats is not None:
+            self._stats.inc("robots_requests")
+
+        ttl = self._config.ttl
+        if response.exception is not None or response.status is None or response.status >= 500:
+            self._logger.debug(f"robots.txt unavailable, allow all: {origin}: {response.exception or response.status}")
+            rules, ttl = RobotsRules(), self._config.error_ttl
+        elif response.status >= 400:
+            rules = RobotsRules()
+        else:
+            rules = parse_robots(response.text() or "", self._config.user_agent)
+
+        self._cache[origin] = (time.monotonic() + ttl, rules)
+        while len(self._cache) > self._config.cache_size:
+            self._cache.popitem(last=False)
+
+        if rules.delay and self._host_scheduler is not None:
+            self._apply_delay(urlsplit(origin).hostname or "", rules)
+        return rules
+
+    def _apply_delay(self, host: str, rules: RobotsRules) -> None:
+        if self._config.respect_crawl_delay:
+            self._host_scheduler.set_min_interval(host, min(rules.delay, self._config.max_crawl_delay))
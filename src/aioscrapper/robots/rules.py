@@ -0,0 +1,142 @@
+import re
+from urllib.parse import urlsplit
+
+_RATE_UNITS = {"s": 1.0, "m": 60.0, "h": 3600.0, "d": 86400.0}
+
+
+class _Rule:
+    __slots__ = ("pattern", "allow", "_prefix", "_regex")
+
+    def __init__(self, pattern: str, allow: bool) -> None:
+        self.pattern = pattern
+        self.allow = allow
+        if "*" in pattern or pattern.endswith("$"):
+            end = pattern.endswith("$")
+            body = re.escape(pattern[:-1] if end else pattern).replace(r"\*", ".*")
+            self._prefix = None
+            self._regex = re.compile(body + ("$" if end else ""))
+        else:
+            self._prefix = pattern
+            self._regex = None
+
+    def match(self, path: str) -> bool:
+        if self._prefix is not None:
+            return path.startswith(self._prefix)
+        return self._regex.match(path) is not None
+
+
+class RobotsRules:
+    __slots__ = ("_rules", "crawl_delay", "request_rate", "sitemaps")
+
+    def __init__(
+        self,
+        rules: list[tuple[str, bool]] | None = None,
+        crawl_delay: float | None = None,
+        request_rate: float | None = None,
+        sitemaps: list[str] | None = None,
+    ) -> None:
+        self._rules = [
+            _Rule(pattern, allow)
+            for pattern, allow in sorted(rules or (), key=lambda rule: (-len(rule[0]), not rule[1]))
+            if pattern
+        ]
+        self.crawl_delay = crawl_delay
+        self.request_rate = request_rate
+        self.sitemaps = sitemaps or []
+
+    @property
+    def delay(self) -> float | None:
+        delays = [delay for delay in (self.crawl_delay, self.request_rate) if delay is not None]
+        return max(delays) if delays else None
+
+    def allowed(self, url: str) -> bool:
+        if not self._rules:
+            return True
+
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if path == "/robots.txt":
+            return True
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        for rule in self._rules:
+            if rule.match(path):
+                return rule.allow
+        return True
+
+
+def _parse_rate(value: str) -> float | None:
+    parts = value.split()
+    if not parts:
+        return None
+
+    requests, _, period = parts[0].lower().partition("/")
+    unit = _RATE_UNITS.get(period[-1:])
+    if unit is not None:
+        period = period[:-1]
+    try:
+        count, seconds = int(requests), float(period or 1) * (unit or 1.0)
+    except ValueError:
+        return None
+    return seconds / count if count > 0 else None
+
+
+def _parse_delay(value: str) -> float | None:
+    try:
+        delay = float(value)
+    except ValueError:
+        return None
+    return delay if delay >= 0 else None
+
+
+class _Group:
+    __slots__ = ("rules", "crawl_delay", "request_rate")
+
+    def __init__(self) -> None:
+        self.rules: list[tuple[str, bool]] = []
+        self.crawl_delay: float | None = None
+        self.request_rate: float | None = None
+
+
+def parse_robots(content: str, user_agent: str = "*") -> RobotsRules:
+    token = user_agent.split("/", 1)[0].strip().lower()
+    groups: dict[str, _Group] = {}
+    agents: list[_Group] = []
+    sitemaps: list[str] = []
+    in_rules = False
+    for line in content.splitlines():
+        name, sep, value = line.split("#", 1)[0].partition(":")
+        if not sep:
+            continue
+
+        name, value = name.strip().lower(), value.strip()
+        if name == "user-agent":
+            if in_rules:
+                agents, in_rules = [], False
+            agents.append(groups.setdefault(value.lower(), _Group()))
+            continue
+        if name == "sitemap":
+            if value:
+                sitemaps.append(value)
+            continue
+
+        in_rules = True
+        for group in agents:
+            if name in ("allow", "disallow"):
+                group.rules.append((value, name == "allow"))
+            elif name == "crawl-delay":
+                group.crawl_delay = _parse_delay(value)
+            elif name == "request-rate":
+                group.request_rate = _parse_rate(value)
+
+    matched = [agent for agent in groups if agent != "*" and token != "*" and token.startswith(agent)]
+    group = groups.get(max(matched, key=len)) if matched else groups.get("*")
+    if group is None:
+        return RobotsRules(sitemaps=sitemaps)
+    return RobotsRules(
+        group.rules,
+        crawl_delay=group.crawl_delay,
+        request_rate=group.request_rate,
+        sitemaps=sitemaps,
+    )
@@ -0,0 +1,5 @@
+from .activity import ActivityCounter
+from .delay import DelayQueue
+from .hedge import HedgePolicy
+from .host import HostScheduler, HostSlot, get_host
+from .throttle import AutoThrottle, ThrottleState
@@ -0,0 +1,35 @@
+import asyncio
+
+
+class ActivityCounter:
+    def __init__(self) -> None:
+        self._count = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._released = asyncio.Event()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def idle(self) -> bool:
+        return self._count == 0
+
+    def inc(self, value: int = 1) -> None:
+        self._count += value
+        if self._count > 0:
+            self._idle.clear()
+
+    def dec(self, value: int = 1) -> None:
+        self._count = max(self._count - value, 0)
+        self._released.set()
+        if self._count == 0:
+            self._idle.set()
+
+    async def wait_idle(self) -> None:
+        await self._idle.wait()
+
+    async def wait_below(self, value: int) -> None:
+        while self._count >= value:
+            self._released.clear()
+            await self._released.wait()
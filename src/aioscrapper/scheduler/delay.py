@@ -0,0 +1,46 @@
+import asyncio
+import heapq
+import time
+from typing import Iterator
+
+from ..types import PRPRequest
+
+
+class DelayQueue:
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, PRPRequest]] = []
+        self._counter = 0
+        self._wakeup = asyncio.Event()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[PRPRequest]:
+        return (r for _, _, r in self._heap)
+
+    def put(self, r: PRPRequest, delay: float) -> None:
+        self._counter += 1
+        heapq.heappush(self._heap, (time.monotonic() + delay, self._counter, r))
+        self._wakeup.set()
+
+    async def get(self) -> PRPRequest | None:
+        while not self._closed:
+            now = time.monotonic()
+            if self._heap and self._heap[0][0] <= now:
+                return heapq.heappop(self._heap)[2]
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=self._heap[0][0] - now if self._heap else None,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+        return None
+
+    def close(self) -> None:
+        self._closed = True
+        self._wakeup.set()
@@ -0,0 +1,41 @@
+from collections import OrderedDict
+
+from .host import get_host
+from ..config import HedgeConfig
+from ..stats import LatencyHistogram
+from ..types import Request
+
+
+class HedgePolicy:
+    def __init__(self, config: HedgeConfig) -> None:
+        self._config = config
+        self._methods = frozenset(method.upper() for method in config.methods)
+        self._latencies: OrderedDict[str, LatencyHistogram] = OrderedDict()
+        self._delays: dict[str, float] = {}
+
+    @property
+    def max_hedges(self) -> int:
+        return self._config.max_hedges
+
+    @property
+    def delays(self) -> dict[str, float]:
+        return self._delays
+
+    def get_delay(self, request: Request) -> float | None:
+        if request.stream or request.method.upper() not in self._methods:
+            return None
+        return self._delays.get(get_host(request.url))
+
+    def observe(self, host: str, latency: float) -> None:
+        histogram = self._latencies.get(host)
+        if histogram is None:
+            histogram = self._latencies[host] = LatencyHistogram()
+            while len(self._latencies) > self._config.max_hosts:
+                evicted, _ = self._latencies.popitem(last=False)
+                self._delays.pop(evicted, None)
+        else:
+            self._latencies.move_to_end(host)
+        histogram.record(latency)
+
+        if histogram.count % self._config.min_samples == 0:
+            self._delays[host] = max(histogram.percentile(self._config.percentile), self._config.min_delay)
@@ -0,0 +1,189 @@
+import asyncio
+import heapq
+import time
+from collections import OrderedDict, deque
+from dataclasses import replace
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Iterator
+from urllib.parse import urlsplit
+
+from ..config import HostSchedulerConfig, HostLimit
+from ..types import PRPRequest
+
+if TYPE_CHECKING:
+    from .throttle import AutoThrottle
+
+
+def get_host(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+class HostSlot:
+    __slots__ = ("host", "limit", "max_in_flight", "min_interval", "in_flight", "next_time", "pending", "scheduled")
+
+    def __init__(self, host: str, limit: HostLimit) -> None:
+        self.host = host
+        self.limit = limit
+        self.max_in_flight = limit.max_in_flight
+        self.min_interval = limit.min_interval
+        self.in_flight = 0
+        self.next_time = 0.0
+        self.pending: list[tuple[int, int, PRPRequest]] = []
+        self.scheduled = False
+
+    @property
+    def available(self) -> bool:
+        return self.max_in_flight is None or self.in_flight < self.max_in_flight
+
+
+class HostScheduler:
+    def __init__(
+        self,
+        config: HostSchedulerConfig,
+        autothrottle: "AutoThrottle | None" = None,
+        lifo: bool = False,
+    ) -> None:
+        self._config = config
+        self._autothrottle = autothrottle
+        self._lifo = lifo
+        self._slots: dict[str, HostSlot] = {}
+        self._ready: deque[HostSlot] = deque()
+        self._idle: OrderedDict[str, float] = OrderedDict()
+        self._timers: list[tuple[float, int, HostSlot]] = []
+        self._timers_counter = 0
+        self._pending_counter = 0
+        self._wakeup = asyncio.Event()
+        self._size = 0
+        self._closed = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[PRPRequest]:
+        for slot in self._slots.values():
+            for _, _, r in slot.pending:
+                yield r
+
+    @property
+    def slots(self) -> dict[str, HostSlot]:
+        return self._slots
+
+    def _get_limit(self, host: str) -> HostLimit:
+        if (limit := self._config.hosts.get(host)) is not None:
+            return limit
+
+        for pattern, limit in self._config.hosts.items():
+            if fnmatchcase(host, pattern):
+                return limit
+
+        return self._config.default
+
+    def get_slot(self, host: str) -> HostSlot:
+        slot = self._slots.get(host)
+        if slot is None:
+            slot = self._slots[host] = HostSlot(host, self._get_limit(host))
+            if self._autothrottle is not None:
+                self._autothrottle.init_slot(slot)
+            self._mark_idle(slot, time.monotonic())
+        return slot
+
+    def _schedule(self, slot: HostSlot) -> None:
+        if slot.scheduled or not slot.pending or not slot.available:
+            return
+
+        slot.scheduled = True
+        if slot.next_time <= time.monotonic():
+            self._ready.append(slot)
+        else:
+            self._timers_counter += 1
+            heapq.heappush(self._timers, (slot.next_time, self._timers_counter, slot))
+        self._wakeup.set()
+
+    def _promote_timers(self, now: float) -> None:
+        while self._timers and self._timers[0][0] <= now:
+            _, _, slot = heapq.heappop(self._timers)
+            self._ready.append(slot)
+
+    def _mark_idle(self, slot: HostSlot, now: float) -> None:
+        if self._config.idle_ttl is not None and not slot.in_flight and not slot.pending:
+            self._idle[slot.host] = now
+            self._idle.move_to_end(slot.host)
+
+    def _evict_idle(self, now: float) -> None:
+        ttl = self._config.idle_ttl
+        while self._idle:
+            host, idle_since = next(iter(self._idle.items()))
+            if idle_since + ttl > now:
+                return
+
+            del self._idle[host]
+            slot = self._slots.get(host)
+            if slot is None or slot.in_flight or slot.pending:
+                continue
+            if slot.next_time > now:
+                self._idle[host] = slot.next_time
+                continue
+
+            del self._slots[host]
+            if self._autothrottle is not None:
+                self._autothrottle.remove_slot(slot)
+
+    def set_min_interval(self, host: str, interval: float) -> None:
+        slot = self.get_slot(host)
+        if interval > slot.limit.min_interval:
+            slot.limit = replace(slot.limit, min_interval=interval)
+        slot.min_interval = max(slot.min_interval, interval)
+
+    def put(self, r: PRPRequest) -> bool:
+        slot = self.get_slot(get_host(r.request.url))
+        self._idle.pop(slot.host, None)
+        self._pending_counter += 1
+        heapq.heappush(slot.pending, (r.priority, -self._pending_counter if self._lifo else self._pending_counter, r))
+        self._size += 1
+        self._schedule(slot)
+        if slot.next_time > time.monotonic():
+            return False
+        if slot.min_interval:
+            return slot.available and len(slot.pending) == 1
+        return slot.max_in_flight is None or slot.in_flight + len(slot.pending) <= slot.max_in_flight
+
+    async def get(self) -> PRPRequest | None:
+        while not self._closed:
+            now = time.monotonic()
+            self._promote_timers(now)
+            if self._idle:
+                self._evict_idle(now)
+            if self._ready:
+                slot = self._ready.popleft()
+                slot.scheduled = False
+                if not slot.available or slot.next_time > now:
+                    self._schedule(slot)
+                    continue
+
+                _, _, r = heapq.heappop(slot.pending)
+                self._size -= 1
+                slot.in_flight += 1
+                slot.next_time = now + slot.min_interval
+                self._schedule(slot)
+                return r
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=self._timers[0][0] - now if self._timers else None,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+        return None
+
+    def release(self, host: str) -> None:
+        slot = self._slots[host]
+        slot.in_flight -= 1
+        self._schedule(slot)
+        self._mark_idle(slot, time.monotonic())
+
+    def close(self) -> None:
+        self._closed = True
+        self._wakeup.set()
@@ -0,0 +1,69 @@
+import time
+from dataclasses import dataclass
+
+from .host import HostSlot
+from ..config import AutoThrottleConfig
+from ..helpers import parse_retry_after
+from ..types import Response
+
+
+@dataclass(slots=True)
+class ThrottleState:
+    delay: float
+    concurrency: float
+    latency: float | None = None
+    responses: int = 0
+    throttled: int = 0
+
+
+class AutoThrottle:
+    def __init__(self, config: AutoThrottleConfig) -> None:
+        self._config = config
+        self._states: dict[str, ThrottleState] = {}
+
+    @property
+    def state(self) -> dict[str, ThrottleState]:
+        return self._states
+
+    def init_slot(self, slot: HostSlot) -> None:
+        state = self._states[slot.host] = ThrottleState(
+            delay=self._config.start_delay,
+            concurrency=float(self._config.start_concurrency),
+        )
+        self._apply(slot, state)
+
+    def remove_slot(self, slot: HostSlot) -> None:
+        self._states.pop(slot.host, None)
+
+    def _apply(self, slot: HostSlot, state: ThrottleState) -> None:
+        slot.min_interval = max(state.delay, slot.limit.min_interval)
+        concurrency = max(int(state.concurrency), 1)
+        slot.max_in_flight = (
+            concurrency if slot.limit.max_in_flight is None else min(concurrency, slot.limit.max_in_flight)
+        )
+
+    def _clamp_delay(self, delay: float) -> float:
+        return min(max(delay, self._config.min_delay), self._config.max_delay)
+
+    def observe(self, slot: HostSlot, latency: float, response: Response) -> None:
+        state = self._states[slot.host]
+        state.responses += 1
+        state.latency = latency if state.latency is None else (state.latency + latency) / 2
+
+        if response.status in self._config.throttle_statuses:
+            state.throttled += 1
+            retry_after = parse_retry_after((response.headers or {}).get("Retry-After"))
+            state.delay = self._clamp_delay(max(state.delay * 2, retry_after or 0.0, latency))
+            state.concurrency = max(state.concurrency / 2, 1.0)
+            if retry_after is not None:
+                slot.next_time = max(slot.next_time, time.monotonic() + retry_after)
+        else:
+            target_delay = latency / self._config.target_concurrency
+            new_delay = max(target_delay, (state.delay + target_delay) / 2)
+            if response.exception is not None or (response.status is not None and response.status >= 400):
+                new_delay = max(new_delay, state.delay)
+            else:
+                state.concurrency = min(state.concurrency + 1 / state.concurrency, float(self._config.max_concurrency))
+            state.delay = self._clamp_delay(new_delay)
+
+        self._apply(slot, state)
@@ -4,9 +4,15 @@ from ..request_sender import RequestSender
 
 
 class BaseScrapper(ABC):
+    @property
+    def name(self) -> str:
+        return self.__class__.__name__
+
     @abstractmethod
     async def start(self, request_sender: RequestSender) -> None: ...
 
+    async def idle(self, request_sender: RequestSender) -> None: ...
+
     async def initialize(self) -> None: ...
 
     async def close(self) -> None: ...
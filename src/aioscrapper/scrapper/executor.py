@@ -1,16 +1,28 @@
 import asyncio
+import itertools
+import os
 import time
+from dataclasses import replace
 from logging import Logger, getLogger
 
 from aiojobs import Scheduler
 
+from ..cache import get_cache_storage
 from ..config import Config
+from ..distributed import DistributedQueue, get_frontier_backend
+from ..dupefilter import get_dupefilter
+from ..frontier import BoundedPriorityQueue, FairQueue, SpillStore, JobStore
 from ..middleware import RequestOuterMiddleware, RequestInnerMiddleware, ResponseMiddleware
+from ..offload import OffloadExecutor
 from ..pipeline import Pipeline, BasePipeline
 from ..request_sender import RequestSender
 from ..request_worker import RequestWorker
+from ..robots import RobotsManager
+from ..scheduler import ActivityCounter, HostScheduler, AutoThrottle, HedgePolicy
 from ..scrapper import BaseScrapper
-from ..session import get_session_wrapper
+from ..serialization import RequestCodec, get_object_refs
+from ..session import get_session_wrapper, CachingSession, CacheStats, ProxyManager
+from ..stats import StatsCollector, MetricsServer
 from ..types import ShutdownStatus
 
 
@@ -31,42 +43,217 @@ class AIOScrapper:
         self._start_time = time.time()
 
         self._config = config or Config()
+        self._stats = (
+            StatsCollector(self._logger.getChild("stats"), self._config.stats) if self._config.stats.enabled else None
+        )
+        self._metrics_server = (
+            MetricsServer(
+                self._stats,
+                logger=self._logger.getChild("stats"),
+                host=self._config.stats.prometheus_host,
+                port=self._config.stats.prometheus_port,
+            )
+            if self._stats is not None and self._config.stats.prometheus_port is not None
+            else None
+        )
 
         self._scheduler = Scheduler(
             limit=self._config.scheduler.concurrent_requests,
             pending_limit=self._config.scheduler.pending_requests,
             close_timeout=self._config.scheduler.close_timeout,
         )
+        self._processing_scheduler = Scheduler(
+            limit=self._config.scheduler.concurrent_processing,
+            pending_limit=self._config.scheduler.pending_processing,
+            close_timeout=self._config.scheduler.close_timeout,
+        )
+
+        self._activity = ActivityCounter()
 
         if pipelines:
             self._logger.info(
                 f"set pipelines: "
                 + ", ".join(f"{k}: " + ", ".join(map(lambda p: p.__class__.__name__, v)) for k, v in pipelines.items())
             )
-        self._pipeline = Pipeline(logger=self._logger.getChild("pipeline"), pipelines=pipelines)
+        self._pipeline = Pipeline(
+            logger=self._logger.getChild("pipeline"),
+            pipelines=pipelines,
+            config=self._config.pipeline,
+            stats=self._stats,
+            activity=self._activity,
+        )
+
+        codec = RequestCodec(get_object_refs(self._scrappers, prefix="scrapper"))
+        self._job_store: JobStore | None = None
+        dupefilter_config = self._config.dupefilter
+        if self._config.distributed.backend is not None:
+            store = None
+        elif self._config.job.path is not None:
+            self._job_store = JobStore(
+                codec,
+                path=self._config.job.path,
+                batch_size=self._config.queue.spill_batch_size,
+            )
+            if dupefilter_config.path is None:
+                dupefilter_config = replace(
+                    dupefilter_config,
+                    path=os.path.join(self._config.job.path, "dupefilter.bin"),
+                )
+            store = self._job_store
+        elif self._config.queue.spill:
+            store = SpillStore(
+                codec,
+                path=self._config.queue.spill_path,
+                batch_size=self._config.queue.spill_batch_size,
+            )
+        else:
+            store = None
 
-        self._request_queue = asyncio.PriorityQueue()
-        self._request_sender = RequestSender(self._request_queue)
+        if self._config.distributed.backend is not None:
+            self._request_queue: BoundedPriorityQueue = DistributedQueue(
+                get_frontier_backend(self._config.distributed),
+                codec=codec,
+                config=self._config.distributed,
+                dupefilter=dupefilter_config.enabled,
+                digest_size=dupefilter_config.digest_size,
+                activity=self._activity,
+                window=self._get_handoff_window(),
+            )
+            self._dupefilter = None
+        elif self._config.fair_share.enabled and len(self._scrappers) > 1:
+            self._request_queue = FairQueue(
+                self._config.queue,
+                fair_share=self._config.fair_share,
+                window=self._get_handoff_window(),
+                store=store,
+                activity=self._activity,
+            )
+            self._dupefilter = get_dupefilter(dupefilter_config)
+        else:
+            self._request_queue = BoundedPriorityQueue(
+                self._config.queue,
+                store=store,
+                activity=self._activity,
+                window=self._get_handoff_window(),
+            )
+            self._dupefilter = get_dupefilter(dupefilter_config)
+        self._checkpoint_task: asyncio.Task | None = None
+        self._request_sender = self._create_request_sender()
+        self._request_senders = [self._create_request_sender(name) for name in _get_scrapper_names(self._scrappers)]
 
+        self._autothrottle = (
+            AutoThrottle(self._config.scheduler.autothrottle) if self._config.scheduler.autothrottle.enabled else None
+        )
+
+        self._proxies = ProxyManager(self._config.session.proxy) if self._config.session.proxy.proxies else None
         session = get_session_wrapper(self._config.session.lib)(
             timeout=self._config.session.request.timeout,
             ssl=self._config.session.request.ssl,
+            max_body_size=self._config.session.request.max_body_size,
+            chunk_size=self._config.session.request.chunk_size,
+            stats=self._stats,
+            connection=(
+                replace(self._config.session.connection, limit=self._config.scheduler.concurrent_requests)
+                if self._config.session.connection.limit is None
+                else self._config.session.connection
+            ),
+            proxies=self._proxies,
         )
         self._logger.info(f"set http session: {session.__class__.__name__}")
+        self._cache_session: CachingSession | None = None
+        if self._config.session.cache.enabled:
+            session = self._cache_session = CachingSession(
+                session,
+                storage=get_cache_storage(self._config.session.cache),
+                config=self._config.session.cache,
+            )
+            self._logger.info(f"set http cache: {self._config.session.cache.backend}")
+        host_scheduler = HostScheduler(
+            self._config.scheduler.host,
+            autothrottle=self._autothrottle,
+            lifo=self._config.queue.order == "lifo",
+        )
         self._request_worker = RequestWorker(
             logger=self._logger.getChild("request_worker"),
             session=session,
             schedule_request=self._scheduler.spawn,
+            schedule_processing=self._processing_scheduler.spawn,
             sender=self._request_sender,
             queue=self._request_queue,
+            host_scheduler=host_scheduler,
             delay=self._config.session.request.delay,
             shutdown_timeout=self._config.execution.shutdown_timeout,
             srv_kwargs={"pipeline": self._pipeline},
+            senders=self._request_senders,
+            retry=self._config.retry,
+            offload_executor=OffloadExecutor(self._config.offload),
+            response_buffer=self._config.scheduler.response_buffer,
+            autothrottle=self._autothrottle,
+            hedge=HedgePolicy(self._config.hedge) if self._config.hedge.enabled else None,
+            robots=(
+                RobotsManager(
+                    session,
+                    config=self._config.robots,
+                    logger=self._logger.getChild("robots"),
+                    host_scheduler=host_scheduler,
+                    stats=self._stats,
+                )
+                if self._config.robots.enabled
+                else None
+            ),
+            stats=self._stats,
             request_outer_middlewares=request_outer_middlewares,
             request_inner_middlewares=request_inner_middlewares,
             response_middlewares=response_middlewares,
         )
 
+        if self._stats is not None:
+            self._stats.add_gauge("active", lambda: len(self._activity))
+            self._stats.add_gauge("queue_size", self._request_queue.qsize)
+            self._stats.add_gauge("queue_leased", lambda: self._request_queue.leased)
+            self._stats.add_gauge("queue_spilled", lambda: self._request_queue.spilled)
+            self._stats.add_gauge("scheduler_jobs", lambda: len(self._scheduler))
+            self._stats.add_gauge("scheduler_active", lambda: self._scheduler.active_count)
+            self._stats.add_gauge("host_pending", lambda: len(host_scheduler))
+            self._stats.add_gauge("hosts", lambda: len(host_scheduler.slots))
+            self._stats.add_gauge("in_flight", lambda: self._request_worker.in_flight)
+            self._stats.add_gauge("delayed", lambda: self._request_worker.delayed)
+            self._stats.add_gauge("response_buffer", lambda: self._request_worker.buffered)
+            self._stats.add_gauge("processing", lambda: self._request_worker.processing)
+            self._stats.add_gauge("processing_active", lambda: self._processing_scheduler.active_count)
+            self._stats.add_gauge("robots_pending", lambda: self._request_worker.robots_pending)
+            self._stats.add_gauge("pipeline_pending", lambda: len(self._pipeline))
+
+    def _get_handoff_window(self) -> int:
+        scheduler = self._config.scheduler
+        return scheduler.handoff_window or scheduler.concurrent_requests + scheduler.pending_requests
+
+    def _create_request_sender(self, scrapper: str | None = None) -> RequestSender:
+        return RequestSender(
+            self._request_queue,
+            dupefilter=self._dupefilter,
+            digest_size=self._config.dupefilter.digest_size,
+            activity=self._activity,
+            max_depth=self._config.queue.max_depth,
+            scrapper=scrapper,
+        )
+
+    @property
+    def stats(self) -> StatsCollector | None:
+        return self._stats
+
+    @property
+    def proxies(self) -> ProxyManager | None:
+        return self._proxies
+
+    @property
+    def autothrottle(self) -> AutoThrottle | None:
+        return self._autothrottle
+
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        return self._cache_session.stats if self._cache_session is not None else None
+
     @classmethod
     async def create(
         cls,
@@ -91,37 +278,75 @@ class AIOScrapper:
         return instance
 
     async def initialize(self) -> None:
+        if self._stats is not None:
+            self._stats.start()
+        if self._metrics_server is not None:
+            await self._metrics_server.start()
         await self._pipeline.initialize()
+        if self._dupefilter is not None:
+            await self._dupefilter.initialize()
+        await self._request_queue.initialize()
+        if self._job_store is not None:
+            requests = self._job_store.load_snapshot()
+            self._request_queue.restore(requests)
+            self._logger.info(f"resume job {self._config.job.path}: {len(requests) + len(self._job_store)} requests")
+            self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
         self._request_worker.listen_queue()
 
         for scrapper in self._scrappers:
             await scrapper.initialize()
 
     async def start(self) -> None:
-        await asyncio.gather(*[scrapper.start(request_sender=self._request_sender) for scrapper in self._scrappers])
+        await asyncio.gather(
+            *[
+                scrapper.start(request_sender=request_sender)
+                for scrapper, request_sender in zip(self._scrappers, self._request_senders)
+            ]
+        )
+
+    def _get_execution_timeout(self) -> float | None:
+        if not self._config.execution.timeout:
+            return None
+        return max(self._config.execution.timeout - (time.time() - self._start_time), 0.1)
 
     async def _shutdown(self) -> ShutdownStatus:
         status = ShutdownStatus.OK
-        execution_timeout = (
-            max(self._config.execution.timeout - (time.time() - self._start_time), 0.1)
-            if self._config.execution.timeout
-            else None
-        )
         while True:
-            if execution_timeout is not None and time.time() - self._start_time > execution_timeout:
+            try:
+                await asyncio.wait_for(self._activity.wait_idle(), timeout=self._get_execution_timeout())
+            except asyncio.TimeoutError:
                 self._logger.log(
                     level=self._config.execution.log_level,
                     msg=f"execution timeout: {self._config.execution.timeout}!",
                 )
                 status = ShutdownStatus.TIMEOUT
                 break
-            if len(self._scheduler) == 0 and self._request_queue.qsize() == 0:
-                break
 
-            await asyncio.sleep(self._config.execution.shutdown_check_interval)
+            for scrapper, request_sender in zip(self._scrappers, self._request_senders):
+                await scrapper.idle(request_sender=request_sender)
+            if self._activity.idle:
+                break
 
         return status
 
+    async def checkpoint(self) -> None:
+        if self._job_store is None:
+            return
+
+        await self._job_store.checkpoint(
+            itertools.chain(self._request_queue, self._request_worker.get_pending_requests())
+        )
+        if self._dupefilter is not None:
+            self._dupefilter.save()
+
+    async def _checkpoint_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.job.checkpoint_interval)
+            try:
+                await self.checkpoint()
+            except Exception:
+                self._logger.exception(f"checkpoint of job {self._config.job.path} failed")
+
     async def shutdown(self) -> None:
         status = await self._shutdown()
         await self._request_worker.shutdown(status == ShutdownStatus.TIMEOUT)
@@ -130,9 +355,35 @@ class AIOScrapper:
         if shutdown:
             await self.shutdown()
 
-        for scrapper in self._scrappers:
-            await scrapper.close()
+        if self._checkpoint_task is not None:
+            self._checkpoint_task.cancel()
+        try:
+            await self.checkpoint()
+        except Exception:
+            self._logger.exception(f"checkpoint of job {self._config.job.path} failed")
+        finally:
+            for scrapper in self._scrappers:
+                await scrapper.close()
+
+            await self._scheduler.close()
+            await self._request_worker.close()
+            await self._processing_scheduler.close()
+            await self._pipeline.close()
+            await self._request_queue.close()
+            if self._dupefilter is not None:
+                await self._dupefilter.close()
+            if self._stats is not None:
+                await self._stats.close()
+            if self._metrics_server is not None:
+                await self._metrics_server.close()
+
 
-        await self._scheduler.close()
-        await self._request_worker.close()
-        await self._pipeline.close()
+def _get_scrapper_names(scrappers: list[BaseScrapper]) -> list[str]:
+    names = []
+    for scrapper in scrappers:
+        name, index = scrapper.name, 1
+        while name in names:
+            name = f"{scrapper.name}:{index}"
+            index += 1
+        names.append(name)
+    return names
@@ -0,0 +1,69 @@
+import io
+import pickle
+from dataclasses import fields
+from typing import Any
+
+from .types import PRPRequest, Request, RequestParams
+
+_REQUEST_FIELDS = tuple(f.name for f in fields(Request))
+_REQUEST_PARAMS_FIELDS = tuple(f.name for f in fields(RequestParams))
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, refs: dict[int, str]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._refs = refs
+
+    def persistent_id(self, obj: Any) -> str | None:
+        return self._refs.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, objects: dict[str, Any]) -> None:
+        super().__init__(file)
+        self._objects = objects
+
+    def persistent_load(self, pid: str) -> Any:
+        try:
+            return self._objects[pid]
+        except KeyError:
+            raise pickle.UnpicklingError(f"Unknown object reference: {pid}")
+
+
+class RequestCodec:
+    def __init__(self, objects: dict[str, Any] | None = None) -> None:
+        self._objects = objects or {}
+        self._refs = {id(obj): name for name, obj in self._objects.items()}
+
+    def encode(self, r: PRPRequest) -> bytes:
+        buffer = io.BytesIO()
+        try:
+            _Pickler(buffer, self._refs).dump(
+                (
+                    r.priority,
+                    tuple(getattr(r.request, name) for name in _REQUEST_FIELDS),
+                    tuple(getattr(r.request_params, name) for name in _REQUEST_PARAMS_FIELDS),
+                )
+            )
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            raise TypeError(f"Request can't be serialized: {r.request.method} {r.request.url}: {exc}") from exc
+        return buffer.getvalue()
+
+    def decode(self, data: bytes) -> PRPRequest:
+        priority, request, request_params = _Unpickler(io.BytesIO(data), self._objects).load()
+        return PRPRequest(
+            priority=priority,
+            request=Request(**dict(zip(_REQUEST_FIELDS, request))),
+            request_params=RequestParams(**dict(zip(_REQUEST_PARAMS_FIELDS, request_params))),
+        )
+
+
+def get_object_refs(objects: list[Any], prefix: str) -> dict[str, Any]:
+    refs = {}
+    for obj in objects:
+        name = f"{prefix}:{obj.__class__.__module__}.{obj.__class__.__qualname__}"
+        index = 0
+        while (ref := f"{name}:{index}") in refs:
+            index += 1
+        refs[ref] = obj
+    return refs
@@ -1 +1,3 @@
 from .base import get_session_wrapper
+from .cache import CachingSession, CacheStats
+from .proxy import ProxyManager, ProxyState
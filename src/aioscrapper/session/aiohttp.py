@@ -1,48 +1,150 @@
-from aiohttp import ClientSession, ClientTimeout, TCPConnector
+import asyncio
+from contextlib import asynccontextmanager, AsyncExitStack, AbstractAsyncContextManager
+from functools import partial
+from http.cookies import SimpleCookie
+from typing import Any, AsyncIterator
+
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    ClientResponse,
+    AsyncResolver,
+    ThreadedResolver,
+    ClientError,
+)
+from aiohttp.abc import AbstractResolver
 from aiohttp.helpers import BasicAuth as AiohttpBasicAuth
 
 from .base import BaseSession
-from ..types import Response, Request
+from .proxy import ProxyManager
+from ..config import ConnectionConfig
+from ..stats import StatsCollector
+from ..types import Cookies, Response, Request
+
+
+def _get_cookies(cookies: SimpleCookie) -> Cookies:
+    return {k: f"{v.key}={v.value}" for k, v in cookies.items()}
 
 
 class AiohttpSession(BaseSession):
-    def __init__(self, timeout: float | None = None, ssl: bool | None = None) -> None:
-        super().__init__(timeout, ssl)
+    def __init__(
+        self,
+        timeout: float | None = None,
+        ssl: bool | None = None,
+        max_body_size: int | None = None,
+        chunk_size: int = 65536,
+        stats: StatsCollector | None = None,
+        connection: ConnectionConfig | None = None,
+        proxies: ProxyManager | None = None,
+    ) -> None:
+        super().__init__(timeout, ssl, max_body_size, chunk_size, stats, connection, proxies)
         self._session = ClientSession(
             timeout=ClientTimeout(total=timeout),
-            connector=TCPConnector(ssl=ssl) if ssl is not None else None,
+            connector=TCPConnector(
+                limit=self._connection.limit or 0,
+                limit_per_host=self._connection.limit_per_host or 0,
+                keepalive_timeout=self._connection.keepalive_timeout,
+                use_dns_cache=self._connection.use_dns_cache,
+                ttl_dns_cache=self._connection.dns_cache_ttl,
+                resolver=self._get_resolver(),
+                happy_eyeballs_delay=self._connection.happy_eyeballs_delay,
+                ssl=self._get_ssl_context(),
+            ),
+        )
+
+    @property
+    def transport_errors(self) -> tuple[type[Exception], ...]:
+        return asyncio.TimeoutError, ClientError
+
+    def _get_resolver(self) -> AbstractResolver | None:
+        if self._connection.resolver is None:
+            return None
+        if self._connection.resolver == "async":
+            nameservers = self._connection.nameservers
+            return AsyncResolver(nameservers=list(nameservers) if nameservers else None)
+        if self._connection.resolver == "threaded":
+            return ThreadedResolver()
+
+        raise RuntimeError(f"Unknown resolver: {self._connection.resolver}")
+
+    def _get_request_kwargs(self, request: Request, proxy: str | None) -> dict[str, Any]:
+        return dict(
+            url=request.url,
+            method=request.method,
+            params=request.params,
+            data=request.data,
+            json=request.json_data,
+            cookies=request.cookies,
+            headers=request.headers,
+            proxy=proxy,
+            auth=(
+                AiohttpBasicAuth(login=request.auth["username"], password=request.auth["password"])
+                if request.auth is not None
+                else None
+            ),
+            timeout=(
+                ClientTimeout(total=request.timeout, sock_connect=request.read_timeout, sock_read=request.read_timeout)
+                if request.timeout is not None or request.read_timeout is not None
+                else None
+            ),
+        )
+
+    def _build_response(
+        self,
+        request: Request,
+        response: ClientResponse,
+        content: bytes | None = None,
+        stream: AsyncIterator[bytes] | None = None,
+    ) -> Response:
+        return Response(
+            url=request.url,
+            method=request.method,
+            params=request.params,
+            status=response.status,
+            headers=response.headers,
+            cookies=partial(_get_cookies, response.cookies) if response.cookies else {},
+            content=content,
+            stream=stream,
         )
 
     async def make_request(self, request: Request) -> Response:
+        return await self._send_via_proxy(request, self._make_request)
+
+    async def _make_request(self, request: Request, proxy: str | None) -> Response:
         try:
-            async with self._session.request(
-                url=request.url,
-                method=request.method,
-                params=request.params,
-                data=request.data,
-                json=request.json_data,
-                cookies=request.cookies,
-                headers=request.headers,
-                proxy=request.proxy,
-                auth=(
-                    AiohttpBasicAuth(login=request.auth["username"], password=request.auth["password"])
-                    if request.auth is not None
-                    else None
-                ),
-                timeout=ClientTimeout(total=request.timeout) if request.timeout is not None else None,
-            ) as response:
-                return Response(
-                    url=request.url,
-                    method=request.method,
-                    params=request.params,
-                    status=response.status,
-                    headers=response.headers,
-                    cookies={k: f"{v.key}={v.value}" for k, v in response.cookies.items()},
-                    content=await response.read(),
-                    content_type=response.headers.get("Content-Type"),
-                )
+            async with self._session.request(**self._get_request_kwargs(request, proxy)) as response:
+                if self._get_max_body_size(request) is None:
+                    content = await response.read()
+                    if self._metrics is not None:
+                        self._metrics.inc("response_bytes", len(content))
+                else:
+                    self._check_content_length(request, response.content_length)
+                    content = await self._read_chunks(request, response.content.iter_chunked(self._chunk_size))
+                return self._build_response(request, response, content=content)
         except Exception as exc:
             return Response(url=request.url, method=request.method, params=request.params, exception=exc)
 
+    def stream_request(self, request: Request) -> AbstractAsyncContextManager[Response]:
+        return self._stream_via_proxy(request, self._stream_request)
+
+    @asynccontextmanager
+    async def _stream_request(self, request: Request, proxy: str | None) -> AsyncIterator[Response]:
+        async with AsyncExitStack() as stack:
+            try:
+                response = await stack.enter_async_context(
+                    self._session.request(**self._get_request_kwargs(request, proxy))
+                )
+                self._check_content_length(request, response.content_length)
+                output = self._build_response(
+                    request,
+                    response,
+                    stream=self._limit_chunks(request, response.content.iter_chunked(self._chunk_size)),
+                )
+            except Exception as exc:
+                output = Response(url=request.url, method=request.method, params=request.params, exception=exc)
+
+            yield output
+
     async def close(self) -> None:
         await self._session.close()
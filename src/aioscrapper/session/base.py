@@ -1,19 +1,132 @@
 import abc
-from typing import Type
+import asyncio
+import ssl
+import time
+from contextlib import asynccontextmanager, AbstractAsyncContextManager
+from functools import lru_cache
+from typing import Type, AsyncIterator, Callable, Awaitable
 
+from ..config import ConnectionConfig
+from .proxy import ProxyManager
+from ..exceptions import ResponseTooLargeException
+from ..scheduler import get_host
+from ..stats import StatsCollector
 from ..types import Request, Response
 
 
 class BaseSession(abc.ABC):
-    def __init__(self, timeout: float | None = None, ssl: bool | None = None) -> None:
+    def __init__(
+        self,
+        timeout: float | None = None,
+        ssl: bool | None = None,
+        max_body_size: int | None = None,
+        chunk_size: int = 65536,
+        stats: StatsCollector | None = None,
+        connection: ConnectionConfig | None = None,
+        proxies: ProxyManager | None = None,
+    ) -> None:
         self._timeout = timeout
         self._ssl = ssl
+        self._max_body_size = max_body_size
+        self._chunk_size = chunk_size
+        self._metrics = stats
+        self._connection = connection or ConnectionConfig()
+        self._proxies = proxies
 
     @abc.abstractmethod
     async def make_request(self, request: Request) -> Response: ...
 
+    @asynccontextmanager
+    async def stream_request(self, request: Request) -> AsyncIterator[Response]:
+        yield await self.make_request(request)
+
+    @property
+    def proxies(self) -> ProxyManager | None:
+        return self._proxies
+
+    @property
+    def transport_errors(self) -> tuple[type[Exception], ...]:
+        return asyncio.TimeoutError, OSError
+
+    async def _send_via_proxy(
+        self,
+        request: Request,
+        send: Callable[[Request, str | None], Awaitable[Response]],
+    ) -> Response:
+        if request.proxy is not None or self._proxies is None:
+            return await send(request, request.proxy)
+
+        proxy, response = self._proxies.acquire(get_host(request.url)), None
+        start_time = time.monotonic()
+        try:
+            response = await send(request, proxy.url)
+            return response
+        finally:
+            self._proxies.release(proxy, response, time.monotonic() - start_time)
+
+    @asynccontextmanager
+    async def _stream_via_proxy(
+        self,
+        request: Request,
+        stream: Callable[[Request, str | None], AbstractAsyncContextManager[Response]],
+    ) -> AsyncIterator[Response]:
+        if request.proxy is not None or self._proxies is None:
+            async with stream(request, request.proxy) as response:
+                yield response
+            return
+
+        proxy, response = self._proxies.acquire(get_host(request.url)), None
+        start_time = time.monotonic()
+        try:
+            async with stream(request, proxy.url) as response:
+                self._proxies.release(proxy, response, time.monotonic() - start_time)
+                proxy = None
+                yield response
+        finally:
+            if proxy is not None:
+                self._proxies.release(proxy, response, time.monotonic() - start_time)
+
+    async def get_cached_response(self, request: Request) -> Response | None:
+        return None
+
     async def close(self) -> None: ...
 
+    def _get_ssl_context(self, cafile: str | None = None) -> ssl.SSLContext:
+        if self._connection.ssl_context is not None:
+            return self._connection.ssl_context
+        return get_ssl_context(self._ssl is not False, cafile)
+
+    def _get_max_body_size(self, request: Request) -> int | None:
+        return request.max_body_size if request.max_body_size is not None else self._max_body_size
+
+    def _check_content_length(self, request: Request, content_length: int | str | None) -> None:
+        max_size = self._get_max_body_size(request)
+        if max_size is not None and content_length is not None and int(content_length) > max_size:
+            raise ResponseTooLargeException(max_size=max_size, url=request.url, method=request.method)
+
+    async def _limit_chunks(self, request: Request, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        max_size = self._get_max_body_size(request)
+        size = 0
+        async for chunk in chunks:
+            size += len(chunk)
+            if self._metrics is not None:
+                self._metrics.inc("response_bytes", len(chunk))
+            if max_size is not None and size > max_size:
+                raise ResponseTooLargeException(max_size=max_size, url=request.url, method=request.method)
+            yield chunk
+
+    async def _read_chunks(self, request: Request, chunks: AsyncIterator[bytes]) -> bytes:
+        return b"".join([chunk async for chunk in self._limit_chunks(request, chunks)])
+
+
+@lru_cache
+def get_ssl_context(verify: bool = True, cafile: str | None = None) -> ssl.SSLContext:
+    context = ssl.create_default_context(cafile=cafile)
+    if not verify:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
 
 def get_session_wrapper(session: str | None) -> Type[BaseSession]:
     if session == "aiohttp" or session is None:
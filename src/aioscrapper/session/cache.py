@@ -0,0 +1,121 @@
+import time
+from collections import OrderedDict
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, replace
+
+from .base import BaseSession
+from ..cache import BaseCacheStorage, CacheEntry
+from ..cache.policy import (
+    is_cacheable_request,
+    is_storable,
+    is_fresh,
+    get_conditional_headers,
+    update_from_not_modified,
+)
+from ..config import CacheConfig
+from ..dupefilter import get_request_fingerprint
+from ..types import Request, Response
+
+_MAX_LOOKUPS = 10_000
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stored: int = 0
+
+
+class CachingSession(BaseSession):
+    def __init__(self, session: BaseSession, storage: BaseCacheStorage, config: CacheConfig) -> None:
+        super().__init__(
+            session._timeout,
+            session._ssl,
+            session._max_body_size,
+            session._chunk_size,
+            connection=session._connection,
+            proxies=session._proxies,
+        )
+        self._session = session
+        self._storage = storage
+        self._config = config
+        self._stats = CacheStats()
+        self._lookups: OrderedDict[int, tuple[str, CacheEntry | None]] = OrderedDict()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def _get_key(self, request: Request) -> str:
+        return f"{get_request_fingerprint(request, digest_size=16):032x}"
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        return not self._config.rfc9111 or is_fresh(entry)
+
+    async def _get_entry(self, request: Request, key: str) -> CacheEntry | None:
+        lookup = self._lookups.pop(id(request), None)
+        if lookup is not None and lookup[0] == key:
+            return lookup[1]
+        return await self._storage.get(key)
+
+    async def get_cached_response(self, request: Request) -> Response | None:
+        if self._config.rfc9111 and not is_cacheable_request(request):
+            return None
+
+        key = self._get_key(request)
+        entry = await self._storage.get(key)
+        if entry is None or not self._is_fresh(entry):
+            self._lookups[id(request)] = (key, entry)
+            if len(self._lookups) > _MAX_LOOKUPS:
+                self._lookups.popitem(last=False)
+            return None
+
+        self._stats.hits += 1
+        return entry.to_response(request.params)
+
+    async def make_request(self, request: Request) -> Response:
+        if self._config.rfc9111 and not is_cacheable_request(request):
+            self._stats.misses += 1
+            return await self._session.make_request(request)
+
+        key = self._get_key(request)
+        entry = await self._get_entry(request, key)
+        if entry is not None and self._is_fresh(entry):
+            self._stats.hits += 1
+            return entry.to_response(request.params)
+
+        conditional_headers = get_conditional_headers(entry) if entry is not None and self._config.rfc9111 else None
+        if conditional_headers:
+            response = await self._session.make_request(
+                replace(request, headers={**(request.headers or {}), **conditional_headers})
+            )
+            if response.status == 304:
+                self._stats.revalidated += 1
+                update_from_not_modified(entry, response)
+                await self._storage.set(key, entry)
+                return entry.to_response(request.params)
+        else:
+            response = await self._session.make_request(request)
+
+        self._stats.misses += 1
+        if (
+            response.exception is None
+            and response.status is not None
+            and response.status not in self._config.ignore_statuses
+            and (not self._config.rfc9111 or is_storable(response))
+        ):
+            await self._storage.set(key, CacheEntry.from_response(response, stored_at=time.time()))
+            self._stats.stored += 1
+        return response
+
+    def stream_request(self, request: Request) -> AbstractAsyncContextManager[Response]:
+        return self._session.stream_request(request)
+
+    @property
+    def transport_errors(self) -> tuple[type[Exception], ...]:
+        return self._session.transport_errors
+
+    async def close(self) -> None:
+        await self._session.close()
+        await self._storage.close()
@@ -1,43 +1,175 @@
-from httpx import AsyncClient, BasicAuth
+import asyncio
+import socket
+from collections import OrderedDict
+from contextlib import asynccontextmanager, AsyncExitStack, AbstractAsyncContextManager
+from functools import partial
+from typing import Any, AsyncIterator
+
+import certifi
+from httpx import (
+    AsyncClient,
+    AsyncHTTPTransport,
+    BasicAuth,
+    Limits,
+    Response as HttpxResponse,
+    Timeout,
+    TransportError,
+)
 
 from .base import BaseSession
+from .proxy import ProxyManager
+from ..config import ConnectionConfig
+from ..stats import StatsCollector
 from ..types import Request, Response
 
 
 class HttpxSession(BaseSession):
-    def __init__(self, timeout: float | None = None, ssl: bool | None = None) -> None:
-        super().__init__(timeout, ssl)
-        self._session = AsyncClient(timeout=timeout, verify=ssl if ssl is not None else True)
+    def __init__(
+        self,
+        timeout: float | None = None,
+        ssl: bool | None = None,
+        max_body_size: int | None = None,
+        chunk_size: int = 65536,
+        stats: StatsCollector | None = None,
+        connection: ConnectionConfig | None = None,
+        proxies: ProxyManager | None = None,
+    ) -> None:
+        super().__init__(timeout, ssl, max_body_size, chunk_size, stats, connection, proxies)
+        self._session = AsyncClient(timeout=timeout, transport=self._get_transport())
+        self._clients: OrderedDict[str, AsyncClient] = OrderedDict()
+        self._clients_usage: dict[str, int] = {}
+        self._closing: set[asyncio.Task] = set()
+
+    @property
+    def transport_errors(self) -> tuple[type[Exception], ...]:
+        return asyncio.TimeoutError, TransportError
+
+    def _get_transport(self, proxy: str | None = None) -> AsyncHTTPTransport:
+        return AsyncHTTPTransport(
+            proxy=proxy,
+            verify=self._get_ssl_context(certifi.where()),
+            http2=self._connection.http2,
+            limits=Limits(
+                max_connections=self._connection.limit,
+                max_keepalive_connections=self._connection.keepalive_connections,
+                keepalive_expiry=self._connection.keepalive_timeout,
+            ),
+            socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)] if self._connection.tcp_nodelay else None,
+        )
+
+    def _acquire_client(self, proxy: str | None) -> AsyncClient:
+        if proxy is None:
+            return self._session
+
+        self._clients_usage[proxy] = self._clients_usage.get(proxy, 0) + 1
+        client = self._clients.get(proxy)
+        if client is None:
+            client = self._clients[proxy] = AsyncClient(timeout=self._timeout, transport=self._get_transport(proxy))
+            self._evict_clients(proxy)
+        else:
+            self._clients.move_to_end(proxy)
+        return client
+
+    def _release_client(self, proxy: str | None) -> None:
+        if proxy is not None:
+            self._clients_usage[proxy] -= 1
+
+    def _evict_clients(self, acquired: str) -> None:
+        for proxy in list(self._clients):
+            if len(self._clients) <= self._connection.proxy_clients:
+                break
+            if proxy == acquired or self._clients_usage.get(proxy):
+                continue
+
+            self._clients_usage.pop(proxy, None)
+            task = asyncio.create_task(self._clients.pop(proxy).aclose())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    def _get_request_kwargs(self, request: Request) -> dict[str, Any]:
+        return dict(
+            url=request.url,
+            method=request.method,
+            params=request.params,
+            data=request.data,
+            json=request.json_data,
+            auth=(
+                BasicAuth(username=request.auth["username"], password=request.auth["password"])
+                if request.auth is not None
+                else None
+            ),
+            cookies=request.cookies,  # type: ignore
+            headers=request.headers,
+            timeout=(
+                Timeout(request.timeout, connect=request.read_timeout, read=request.read_timeout)
+                if request.read_timeout is not None
+                else request.timeout
+            ),
+        )
+
+    def _build_response(
+        self,
+        request: Request,
+        response: HttpxResponse,
+        content: bytes | None = None,
+        stream: AsyncIterator[bytes] | None = None,
+    ) -> Response:
+        return Response(
+            url=request.url,
+            method=request.method,
+            params=request.params,
+            status=response.status_code,
+            headers=response.headers,
+            cookies=partial(dict, response.cookies.items()) if response.cookies else {},
+            content=content,
+            stream=stream,
+        )
 
     async def make_request(self, request: Request) -> Response:
+        return await self._send_via_proxy(request, self._make_request)
+
+    async def _make_request(self, request: Request, proxy: str | None) -> Response:
+        client = self._acquire_client(proxy)
         try:
-            response = await self._session.request(
-                url=request.url,
-                method=request.method,
-                params=request.params,
-                data=request.data,
-                json=request.json_data,
-                auth=(
-                    BasicAuth(username=request.auth["username"], password=request.auth["password"])
-                    if request.auth is not None
-                    else None
-                ),
-                cookies=request.cookies,  # type: ignore
-                headers=request.headers,
-                timeout=request.timeout,
-            )
-            return Response(
-                url=request.url,
-                method=request.method,
-                params=request.params,
-                status=response.status_code,
-                headers=response.headers,
-                cookies={k: v for k, v in response.cookies.items()},
-                content=response.content,
-                content_type=response.headers.get("content-type"),
-            )
+            if self._get_max_body_size(request) is None:
+                response = await client.request(**self._get_request_kwargs(request))
+                if self._metrics is not None:
+                    self._metrics.inc("response_bytes", len(response.content))
+                return self._build_response(request, response, content=response.content)
+
+            async with client.stream(**self._get_request_kwargs(request)) as response:
+                self._check_content_length(request, response.headers.get("content-length"))
+                content = await self._read_chunks(request, response.aiter_bytes(self._chunk_size))
+                return self._build_response(request, response, content=content)
         except Exception as exc:
             return Response(url=request.url, method=request.method, params=request.params, exception=exc)
+        finally:
+            self._release_client(proxy)
+
+    def stream_request(self, request: Request) -> AbstractAsyncContextManager[Response]:
+        return self._stream_via_proxy(request, self._stream_request)
+
+    @asynccontextmanager
+    async def _stream_request(self, request: Request, proxy: str | None) -> AsyncIterator[Response]:
+        async with AsyncExitStack() as stack:
+            client = self._acquire_client(proxy)
+            stack.callback(self._release_client, proxy)
+            try:
+                response = await stack.enter_async_context(client.stream(**self._get_request_kwargs(request)))
+                self._check_content_length(request, response.headers.get("content-length"))
+                output = self._build_response(
+                    request,
+                    response,
+                    stream=self._limit_chunks(request, response.aiter_bytes(self._chunk_size)),
+                )
+            except Exception as exc:
+                output = Response(url=request.url, method=request.method, params=request.params, exception=exc)
+
+            yield output
 
     async def close(self) -> None:
         await self._session.aclose()
+        for client in self._clients.values():
+            await client.aclose()
+        if self._closing:
+            await asyncio.gather(*self._closing)
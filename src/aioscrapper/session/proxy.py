@@ -0,0 +1,128 @@
+import time
+from dataclasses import dataclass
+from typing import Iterator
+
+from ..config import ProxyConfig
+from ..types import Response
+
+
+@dataclass(slots=True)
+class ProxyState:
+    url: str
+    in_flight: int = 0
+    requests: int = 0
+    errors: int = 0
+    bans: int = 0
+    latency: float | None = None
+    error_rate: float = 0.0
+    failures: int = 0
+    evictions: int = 0
+    evicted_until: float = 0.0
+
+    @property
+    def score(self) -> float:
+        return (self.latency or 0.0) * (1 + 10 * self.error_rate)
+
+    def is_available(self, now: float) -> bool:
+        return self.evicted_until <= now
+
+
+class ProxyManager:
+    def __init__(self, config: ProxyConfig) -> None:
+        self._config = config
+        self._states: dict[str, ProxyState] = {}
+        self._cycle: list[ProxyState] = []
+        self._cursor = 0
+        self._sticky: dict[str, ProxyState] = {}
+        for url in config.proxies:
+            self.add(url)
+
+    @property
+    def states(self) -> dict[str, ProxyState]:
+        return self._states
+
+    def add(self, url: str) -> None:
+        if url not in self._states:
+            state = self._states[url] = ProxyState(url)
+            self._cycle.append(state)
+
+    def remove(self, url: str) -> None:
+        state = self._states.pop(url, None)
+        if state is not None:
+            self._cycle.remove(state)
+            self._sticky = {host: s for host, s in self._sticky.items() if s is not state}
+
+    def _next(self, now: float) -> ProxyState | None:
+        for _ in range(len(self._cycle)):
+            state = self._cycle[self._cursor % len(self._cycle)]
+            self._cursor += 1
+            if state.is_available(now):
+                return state
+        return None
+
+    def _least_loaded(self, now: float) -> ProxyState | None:
+        return min(
+            (state for state in self._cycle if state.is_available(now)),
+            key=lambda state: (state.in_flight, state.score),
+            default=None,
+        )
+
+    def _select(self, host: str, now: float) -> ProxyState | None:
+        if self._config.strategy == "round_robin":
+            return self._next(now)
+        if self._config.strategy == "least_loaded":
+            return self._least_loaded(now)
+        if self._config.strategy == "sticky":
+            state = self._sticky.get(host)
+            if state is None or not state.is_available(now):
+                state = self._next(now)
+                if state is not None:
+                    self._sticky[host] = state
+            return state
+
+        raise RuntimeError(f"Unknown proxy strategy: {self._config.strategy}")
+
+    def acquire(self, host: str) -> ProxyState | None:
+        if not self._cycle:
+            return None
+
+        now = time.monotonic()
+        state = self._select(host, now) or min(self._cycle, key=lambda s: s.evicted_until)
+        state.in_flight += 1
+        state.requests += 1
+        return state
+
+    def release(self, state: ProxyState, response: Response | None, latency: float) -> None:
+        state.in_flight -= 1
+        if response is None:
+            return
+
+        alpha = self._config.smoothing
+        banned = response.status in self._config.ban_statuses
+        failed = banned or response.exception is not None
+        state.error_rate += alpha * ((1.0 if failed else 0.0) - state.error_rate)
+        if not failed:
+            state.latency = latency if state.latency is None else state.latency + alpha * (latency - state.latency)
+            state.failures = 0
+            state.evictions = 0
+            return
+
+        state.failures += 1
+        if banned:
+            state.bans += 1
+        else:
+            state.errors += 1
+        if banned or state.failures >= self._config.max_failures:
+            self._evict(state)
+
+    def _evict(self, state: ProxyState) -> None:
+        state.evictions += 1
+        state.failures = 0
+        delay = min(self._config.eviction_time * 2 ** (state.evictions - 1), self._config.max_eviction_time)
+        state.evicted_until = time.monotonic() + delay
+
+    def __iter__(self) -> Iterator[ProxyState]:
+        return iter(self._cycle)
+
+    def __len__(self) -> int:
+        return len(self._cycle)
@@ -0,0 +1,3 @@
+from .base import BaseSource
+from .seed import SeedFileSource
+from .sitemap import SitemapEntry, SitemapParser, SitemapSource, parse_lastmod
@@ -0,0 +1,9 @@
+import abc
+from typing import AsyncIterator
+
+from ..request_sender import SendItem
+
+
+class BaseSource(abc.ABC):
+    @abc.abstractmethod
+    def __aiter__(self) -> AsyncIterator[SendItem]: ...
@@ -0,0 +1,57 @@
+import asyncio
+import csv
+import gzip
+import itertools
+from typing import IO, AsyncIterator, Iterator
+
+from .base import BaseSource
+from ..request_sender import SendItem
+
+
+def _open(path: str, encoding: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding=encoding, newline="")
+    return open(path, "r", encoding=encoding, newline="")
+
+
+class SeedFileSource(BaseSource):
+    def __init__(
+        self,
+        path: str,
+        file_format: str | None = None,
+        url_column: str = "url",
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+        batch_size: int = 1000,
+    ) -> None:
+        self._path = path
+        self._format = file_format or ("csv" if path.removesuffix(".gz").endswith(".csv") else "lines")
+        if self._format not in ("lines", "csv"):
+            raise RuntimeError(f"Unknown seed file format: {self._format}")
+
+        self._url_column = url_column
+        self._delimiter = delimiter
+        self._encoding = encoding
+        self._batch_size = batch_size
+
+    def _iter_lines(self, f: IO[str]) -> Iterator[SendItem]:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+    def _iter_csv(self, f: IO[str]) -> Iterator[SendItem]:
+        for row in csv.DictReader(f, delimiter=self._delimiter):
+            url = row.pop(self._url_column, None)
+            if url:
+                yield (url.strip(), row) if row else url.strip()
+
+    async def __aiter__(self) -> AsyncIterator[SendItem]:
+        f = await asyncio.to_thread(_open, self._path, self._encoding)
+        try:
+            items = self._iter_csv(f) if self._format == "csv" else self._iter_lines(f)
+            while batch := await asyncio.to_thread(list, itertools.islice(items, self._batch_size)):
+                for item in batch:
+                    yield item
+        finally:
+            f.close()
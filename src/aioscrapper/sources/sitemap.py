@@ -0,0 +1,189 @@
+import re
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from logging import Logger, getLogger
+from typing import Any, AsyncIterator, Iterable, Iterator
+from urllib.parse import urlsplit
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+from .base import BaseSource
+from ..robots import parse_robots
+from ..session import get_session_wrapper
+from ..session.base import BaseSession
+from ..types import Request
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+@dataclass(slots=True, frozen=True)
+class SitemapEntry:
+    loc: str
+    lastmod: datetime | None = None
+    index: bool = False
+
+
+def parse_lastmod(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        lastmod = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    return lastmod if lastmod.tzinfo is not None else lastmod.replace(tzinfo=timezone.utc)
+
+
+class SitemapParser:
+    def __init__(self, max_chunk_size: int = 1 << 20) -> None:
+        self._max_chunk_size = max_chunk_size
+        self._decompressor: Any = None
+        self._started = False
+        self._text: bool | None = None
+        self._tail = b""
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._root: Element | None = None
+        self._loc: str | None = None
+        self._lastmod: str | None = None
+
+    def feed(self, data: bytes) -> Iterator[SitemapEntry]:
+        if not self._started:
+            self._started = True
+            if data.startswith(_GZIP_MAGIC):
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        if self._decompressor is None:
+            yield from self._feed(data)
+            return
+
+        while data:
+            yield from self._feed(self._decompressor.decompress(data, self._max_chunk_size))
+            data = self._decompressor.unconsumed_tail
+
+    def close(self) -> Iterator[SitemapEntry]:
+        if self._decompressor is not None:
+            yield from self._feed(self._decompressor.flush())
+        if self._text:
+            if loc := self._tail.strip():
+                yield SitemapEntry(loc.decode("utf-8", errors="replace"))
+        elif self._text is not None:
+            self._parser.close()
+            yield from self._read_events()
+
+    def _feed(self, data: bytes) -> Iterator[SitemapEntry]:
+        if self._text is None:
+            if not (data := data.removeprefix(_UTF8_BOM).lstrip()):
+                return
+            self._text = not data.startswith(b"<")
+
+        if self._text:
+            lines = (self._tail + data).split(b"\n")
+            self._tail = lines.pop()
+            for line in lines:
+                if loc := line.strip():
+                    yield SitemapEntry(loc.decode("utf-8", errors="replace"))
+        else:
+            self._parser.feed(data)
+            yield from self._read_events()
+
+    def _read_events(self) -> Iterator[SitemapEntry]:
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                continue
+
+            tag = elem.tag.rpartition("}")[2]
+            if tag == "loc":
+                self._loc = (elem.text or "").strip()
+            elif tag == "lastmod":
+                self._lastmod = elem.text
+            elif tag in ("url", "sitemap"):
+                if self._loc:
+                    yield SitemapEntry(self._loc, parse_lastmod(self._lastmod), index=tag == "sitemap")
+                self._loc = self._lastmod = None
+                if self._root is not None:
+                    self._root.clear()
+
+
+class SitemapSource(BaseSource):
+    def __init__(
+        self,
+        urls: str | Iterable[str],
+        session: BaseSession | None = None,
+        since: datetime | None = None,
+        include: Iterable[str] = (),
+        exclude: Iterable[str] = (),
+        max_depth: int = 3,
+        timeout: float | None = 60.0,
+        logger: Logger | None = None,
+    ) -> None:
+        self._urls = [urls] if isinstance(urls, str) else list(urls)
+        self._session = session
+        self._since = since.replace(tzinfo=timezone.utc) if since is not None and since.tzinfo is None else since
+        self._include = [re.compile(pattern) for pattern in include]
+        self._exclude = [re.compile(pattern) for pattern in exclude]
+        self._max_depth = max_depth
+        self._timeout = timeout
+        self._logger = logger or getLogger("aioscrapper")
+
+    def _is_fresh(self, entry: SitemapEntry) -> bool:
+        return self._since is None or entry.lastmod is None or entry.lastmod >= self._since
+
+    def _is_match(self, entry: SitemapEntry) -> bool:
+        if not self._is_fresh(entry):
+            return False
+        if self._include and not any(pattern.search(entry.loc) for pattern in self._include):
+            return False
+        return not any(pattern.search(entry.loc) for pattern in self._exclude)
+
+    async def _get_robots_sitemaps(self, session: BaseSession, url: str) -> list[str]:
+        response = await session.make_request(Request(url=url, method="GET", timeout=self._timeout))
+        if response.exception is not None or response.status is None or response.status >= 400:
+            self._logger.warning(f"robots.txt unavailable: {url}: {response.exception or response.status}")
+            return []
+        return parse_robots(response.text() or "").sitemaps
+
+    async def iter_entries(self, session: BaseSession, url: str) -> AsyncIterator[SitemapEntry]:
+        request = Request(url=url, method="GET", read_timeout=self._timeout, stream=True)
+        async with session.stream_request(request) as response:
+            if response.exception is not None or response.status is None or response.status >= 400:
+                self._logger.warning(f"sitemap unavailable: {url}: {response.exception or response.status}")
+                return
+
+            parser = SitemapParser()
+            try:
+                async for chunk in response.iter_chunks():
+                    for entry in parser.feed(chunk):
+                        yield entry
+                for entry in parser.close():
+                    yield entry
+            except (ParseError, zlib.error) as exc:
+                self._logger.warning(f"sitemap is malformed: {url}: {exc}")
+            except session.transport_errors as exc:
+                self._logger.warning(f"sitemap download failed: {url}: {exc!r}")
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        session = self._session or get_session_wrapper(None)(timeout=self._timeout)
+        try:
+            queue, seen = deque((url, 0) for url in self._urls), set()
+            while queue:
+                url, depth = queue.popleft()
+                if url in seen:
+                    continue
+                seen.add(url)
+
+                if urlsplit(url).path == "/robots.txt":
+                    queue.extend((sitemap, depth) for sitemap in await self._get_robots_sitemaps(session, url))
+                    continue
+
+                async for entry in self.iter_entries(session, url):
+                    if entry.index:
+                        if depth < self._max_depth and self._is_fresh(entry):
+                            queue.append((entry.loc, depth + 1))
+                    elif self._is_match(entry):
+                        yield entry.loc
+        finally:
+            if self._session is None:
+                await session.close()
@@ -0,0 +1,3 @@
+from .collector import StatsCollector
+from .histogram import LatencyHistogram
+from .server import MetricsServer
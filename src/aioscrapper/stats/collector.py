@@ -0,0 +1,156 @@
+import asyncio
+import time
+from collections import Counter
+from logging import Logger
+from typing import Callable
+
+from .histogram import LatencyHistogram
+from ..config import StatsConfig
+
+_OTHER_HOSTS = "*"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class StatsCollector:
+    def __init__(self, logger: Logger, config: StatsConfig | None = None) -> None:
+        self._logger = logger
+        self._config = config or StatsConfig()
+        self.start_time = time.monotonic()
+        self.counters: Counter[str] = Counter()
+        self.statuses: Counter[int] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.timers: dict[str, LatencyHistogram] = {}
+        self.hosts: dict[str, LatencyHistogram] = {}
+        self.scrappers: dict[str, Counter[str]] = {}
+        self.gauges: dict[str, Callable[[], float]] = {}
+        self._last_log: tuple[float, int] = (self.start_time, 0)
+        self._task: asyncio.Task | None = None
+
+    def inc(self, name: str, value: int = 1) -> None:
+        self.counters[name] += value
+
+    def inc_scrapper(self, scrapper: str, name: str, value: int = 1) -> None:
+        counters = self.scrappers.get(scrapper)
+        if counters is None:
+            counters = self.scrappers[scrapper] = Counter()
+        counters[name] += value
+
+    def observe(self, name: str, duration: float) -> None:
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = LatencyHistogram()
+        timer.record(duration)
+
+    def observe_response(self, host: str, status: int | None, latency: float) -> None:
+        self.counters["responses"] += 1
+        self.statuses[status or 0] += 1
+        histogram = self.hosts.get(host)
+        if histogram is None:
+            if len(self.hosts) >= self._config.max_hosts:
+                host = _OTHER_HOSTS
+            histogram = self.hosts.get(host)
+            if histogram is None:
+                histogram = self.hosts[host] = LatencyHistogram()
+        histogram.record(latency)
+
+    def observe_error(self, exc: BaseException) -> None:
+        self.counters["request_errors"] += 1
+        self.errors[exc.__class__.__name__] += 1
+
+    def add_gauge(self, name: str, func: Callable[[], float]) -> None:
+        self.gauges[name] = func
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start_time
+
+    def get_latency(self) -> LatencyHistogram:
+        histogram = LatencyHistogram()
+        for host_histogram in self.hosts.values():
+            histogram.merge(host_histogram)
+        return histogram
+
+    def report(self) -> str:
+        elapsed = self.elapsed
+        requests = self.counters["requests"]
+        lines = [
+            f"elapsed: {elapsed:.1f}s, requests: {requests} ({requests / max(elapsed, 1e-9):.2f}/s), "
+            f"responses: {self.counters['responses']}, errors: {self.counters['request_errors']}, "
+            f"retries: {self.counters['retries']}, bytes: {self.counters['response_bytes']}",
+        ]
+        if self.statuses:
+            lines.append("statuses: " + ", ".join(f"{k}: {v}" for k, v in sorted(self.statuses.items())))
+        if self.errors:
+            lines.append("errors: " + ", ".join(f"{k}: {v}" for k, v in self.errors.most_common()))
+        for scrapper, counters in sorted(self.scrappers.items()):
+            lines.append(f"scrapper {scrapper}: " + ", ".join(f"{k}: {v}" for k, v in sorted(counters.items())))
+        for name, histogram in (("latency", self.get_latency()), *sorted(self.timers.items())):
+            if histogram.count:
+                quantiles = self._config.quantiles
+                lines.append(
+                    f"{name}: count {histogram.count}, mean {histogram.mean:.3f}s, "
+                    + "".join(f"p{q * 100:g} {v:.3f}s, " for q, v in zip(quantiles, histogram.percentiles(quantiles)))
+                    + f"max {histogram.max:.3f}s"
+                )
+        if self.gauges:
+            lines.append("gauges: " + ", ".join(f"{k}: {func()}" for k, func in self.gauges.items()))
+        return "\n".join(lines)
+
+    def render_prometheus(self) -> str:
+        prefix = self._config.prometheus_prefix
+        lines = []
+        for name in sorted(self.counters):
+            lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {self.counters[name]}"]
+
+        lines.append(f"# TYPE {prefix}_responses_by_status_total counter")
+        for status, count in sorted(self.statuses.items()):
+            lines.append(f'{prefix}_responses_by_status_total{{status="{status}"}} {count}')
+
+        lines.append(f"# TYPE {prefix}_errors_by_type_total counter")
+        for name, count in sorted(self.errors.items()):
+            lines.append(f'{prefix}_errors_by_type_total{{type="{_escape(name)}"}} {count}')
+
+        for name in sorted({name for counters in self.scrappers.values() for name in counters}):
+            lines.append(f"# TYPE {prefix}_scrapper_{name}_total counter")
+            for scrapper, counters in sorted(self.scrappers.items()):
+                lines.append(f'{prefix}_scrapper_{name}_total{{scrapper="{_escape(scrapper)}"}} {counters[name]}')
+
+        summaries = [("request_duration_seconds", f'host="{_escape(host)}",', h) for host, h in self.hosts.items()]
+        summaries += [(f"{name}_duration_seconds", "", h) for name, h in self.timers.items()]
+        types = set()
+        for metric, labels, histogram in sorted(summaries, key=lambda s: s[0]):
+            if metric not in types:
+                types.add(metric)
+                lines.append(f"# TYPE {prefix}_{metric} summary")
+            for q, value in zip(self._config.quantiles, histogram.percentiles(self._config.quantiles)):
+                lines.append(f'{prefix}_{metric}{{{labels}quantile="{q}"}} {value}')
+            labels = f"{{{labels.rstrip(',')}}}" if labels else ""
+            lines.append(f"{prefix}_{metric}_sum{labels} {histogram.sum}")
+            lines.append(f"{prefix}_{metric}_count{labels} {histogram.count}")
+
+        for name, func in self.gauges.items():
+            lines += [f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {func()}"]
+        lines += [f"# TYPE {prefix}_uptime_seconds gauge", f"{prefix}_uptime_seconds {self.elapsed}"]
+        return "\n".join(lines) + "\n"
+
+    def start(self) -> None:
+        if self._config.log_interval:
+            self._task = asyncio.create_task(self._log_loop())
+
+    async def _log_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.log_interval)
+            now, requests = time.monotonic(), self.counters["requests"]
+            last_time, last_requests = self._last_log
+            self._last_log = (now, requests)
+            self._logger.info(
+                f"{(requests - last_requests) / max(now - last_time, 1e-9):.2f} requests/s\n{self.report()}"
+            )
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        self._logger.info(f"crawl stats:\n{self.report()}")
@@ -0,0 +1,62 @@
+import math
+from typing import Iterable
+
+
+class LatencyHistogram:
+    __slots__ = ("_buckets", "count", "sum", "min", "max")
+
+    _LOWEST = 1e-4
+    _GROWTH = 1.05
+    _LOG_GROWTH = math.log(_GROWTH)
+    _MAX_INDEX = int(math.log(1e4 / _LOWEST) / _LOG_GROWTH) + 1
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _get_index(self, value: float) -> int:
+        if value <= self._LOWEST:
+            return 0
+        return min(int(math.log(value / self._LOWEST) / self._LOG_GROWTH) + 1, self._MAX_INDEX)
+
+    def record(self, value: float) -> None:
+        index = self._get_index(value)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        return self.percentiles((q,))[0]
+
+    def percentiles(self, qs: Iterable[float]) -> list[float]:
+        qs = list(qs)
+        if not self.count:
+            return [0.0] * len(qs)
+
+        buckets = sorted(self._buckets.items())
+        output = []
+        for q in qs:
+            rank, seen = max(math.ceil(q * self.count), 1), 0
+            for index, count in buckets:
+                seen += count
+                if seen >= rank:
+                    output.append(min(max(self._LOWEST * self._GROWTH**index, self.min), self.max))
+                    break
+        return output
@@ -3,10 +3,10 @@ from .session import (
     QueryParams,
     Cookies,
     Headers,
+    CIHeaders,
     BasicAuth,
     Request,
     RequestParams,
     PRPRequest,
-    RequestQueue,
     Response,
 )
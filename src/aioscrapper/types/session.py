@@ -1,8 +1,19 @@
-import asyncio
-import json
+import codecs
+import re
 from dataclasses import field, dataclass
-from typing import Union, Mapping, Any, Callable, Awaitable, TypedDict
+from typing import Union, Mapping, Any, Callable, Awaitable, TypedDict, Iterable, Iterator, AsyncIterator
 
+from ..config import RetryConfig
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from msgspec.json import decode as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
+_MISSING = object()
 
 QueryParams = Mapping[str, Union[str, int, float]]
 
@@ -10,6 +21,25 @@ Cookies = Mapping[str, str]
 Headers = Mapping[str, str]
 
 
+class CIHeaders(Mapping[str, str]):
+    def __init__(self, items: Iterable[tuple[str, str]] = ()) -> None:
+        self._items: dict[str, tuple[str, str]] = {}
+        for key, value in items:
+            self._items[key.lower()] = (key, value)
+
+    def __getitem__(self, key: str) -> str:
+        return self._items[key.lower()][1]
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, _ in self._items.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._items.values())!r})"
+
+
 class BasicAuth(TypedDict):
     username: str
     password: str
@@ -27,6 +57,9 @@ class Request:
     auth: BasicAuth | None = None
     proxy: str | None = None
     timeout: float | None = None
+    stream: bool = False
+    max_body_size: int | None = None
+    read_timeout: float | None = None
 
 
 @dataclass(slots=True)
@@ -34,6 +67,12 @@ class RequestParams:
     callback: Callable[..., Awaitable] | None = None
     cb_kwargs: dict[str, Any] | None = None
     errback: Callable[..., Awaitable] | None = None
+    retry: RetryConfig | None = None
+    attempt: int = 0
+    dont_filter: bool = False
+    depth: int = 0
+    scrapper: str | None = None
+    deadline: float | None = None
 
 
 @dataclass(slots=True, order=True)
@@ -43,10 +82,64 @@ class PRPRequest:
     request_params: RequestParams = field(compare=False)
 
 
-RequestQueue = asyncio.PriorityQueue[PRPRequest | None]
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_.:-]+)""", re.IGNORECASE)
+
+
+def get_charset(content_type: str | None) -> str | None:
+    if not content_type:
+        return None
+
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset" and (value := value.strip().strip("\"'")):
+            return value
+    return None
+
+
+def sniff_encoding(content: bytes, content_type: str | None = None) -> str:
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding
+
+    if (charset := get_charset(content_type)) is not None:
+        try:
+            return codecs.lookup(charset).name
+        except LookupError:
+            pass
+
+    if content_type is None or "html" in content_type or "xml" in content_type:
+        if (match := _META_CHARSET_RE.search(content, 0, 2048)) is not None:
+            try:
+                return codecs.lookup(match.group(1).decode("ascii")).name
+            except LookupError:
+                pass
+    return "utf-8"
 
 
 class Response:
+    __slots__ = (
+        "_url",
+        "_method",
+        "_params",
+        "_status",
+        "_headers",
+        "_cookies",
+        "_content",
+        "_content_type",
+        "_exception",
+        "_stream",
+        "_encoding",
+        "_text",
+        "_json",
+    )
+
     def __init__(
         self,
         url: str,
@@ -54,10 +147,11 @@ class Response:
         params: QueryParams | None = None,
         status: int | None = None,
         headers: Headers | None = None,
-        cookies: Cookies | None = None,
+        cookies: Cookies | Callable[[], Cookies] | None = None,
         content: bytes | None = None,
         content_type: str | None = None,
         exception: Exception | None = None,
+        stream: AsyncIterator[bytes] | None = None,
     ) -> None:
         self._url = url
         self._method = method
@@ -68,6 +162,26 @@ class Response:
         self._content = content
         self._content_type = content_type
         self._exception = exception
+        self._stream = stream
+        self._encoding: str | None = None
+        self._text: str | None = None
+        self._json: Any = _MISSING
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return (
+            self._url,
+            self._method,
+            self._params,
+            self._status,
+            self._headers,
+            self.cookies,
+            self._content,
+            self.content_type,
+            self._exception,
+        )
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        self.__init__(*state)
 
     @property
     def url(self) -> str:
@@ -91,21 +205,71 @@ class Response:
 
     @property
     def cookies(self) -> Cookies | None:
+        if callable(self._cookies):
+            self._cookies = self._cookies()
         return self._cookies
 
     @property
     def content_type(self) -> str | None:
+        if self._content_type is None and self._headers is not None:
+            self._content_type = self._headers.get("Content-Type")
         return self._content_type
 
+    @property
+    def encoding(self) -> str | None:
+        if self._encoding is None and self._content is not None:
+            self._encoding = sniff_encoding(self._content, self.content_type)
+        return self._encoding
+
     @property
     def exception(self) -> Exception | None:
         return self._exception
 
-    def bytes(self) -> bytes | None:
+    @property
+    def is_stream(self) -> bool:
+        return self._stream is not None
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        if self._stream is None:
+            if self._content:
+                yield self._content
+            return
+
+        stream, self._stream = self._stream, None
+        async for chunk in stream:
+            yield chunk
+
+    async def read(self) -> bytes | None:
+        if self._stream is not None:
+            self._content = b"".join([chunk async for chunk in self.iter_chunks()])
         return self._content
 
+    async def save(self, path: str) -> int:
+        size = 0
+        with open(path, "wb") as f:
+            async for chunk in self.iter_chunks():
+                f.write(chunk)
+                size += len(chunk)
+        return size
+
+    def view(self) -> memoryview | None:
+        return memoryview(self._content) if self._content is not None else None
+
     def json(self) -> Any:
-        return json.loads(self._content) if self._content is not None else None
+        if self._json is _MISSING:
+            if self._content is None:
+                return None
+            self._json = json_loads(self._content if self.encoding == "utf-8" else self.text())
+        return self._json
 
-    def text(self, encoding: str = "utf-8") -> str | None:
-        return self._content.decode(encoding) if self._content is not None else None
+    def text(self, encoding: str | None = None) -> str | None:
+        if self._content is None:
+            return None
+        if encoding is not None:
+            return self._content.decode(encoding)
+        if self._text is None:
+            self._text = self._content.decode(self.encoding, errors="replace")
+        return self._text
+
+    def bytes(self) -> bytes | None:
+        return self._content
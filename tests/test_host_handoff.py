@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from aioscrapper import AIOScrapper, BaseScrapper
+from aioscrapper.config import Config, FairShareConfig, HostLimit, HostSchedulerConfig, SchedulerConfig
+
+
+class TwoHostScrapper(BaseScrapper):
+    def __init__(self, port: int, slow: int, fast: int) -> None:
+        self.port = port
+        self.slow = slow
+        self.fast = fast
+        self.done: dict[str, list[float]] = {"127.0.0.1": [], "localhost": []}
+
+    async def start(self, request_sender) -> None:
+        for host, count in (("127.0.0.1", self.slow), ("localhost", self.fast)):
+            for i in range(count):
+                await request_sender(f"http://{host}:{self.port}/{i}", callback=self.parse, cb_kwargs={"host": host})
+
+    async def parse(self, response, host: str) -> None:
+        self.done[host].append(time.monotonic())
+
+
+async def handle(request: web.Request) -> web.Response:
+    return web.Response(text="ok")
+
+
+async def crawl(fair: bool) -> tuple[float, float, TwoHostScrapper]:
+    app = web.Application()
+    app.router.add_get("/{i}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    scrapper = TwoHostScrapper(port, slow=40, fast=5)
+    config = Config(
+        scheduler=SchedulerConfig(
+            concurrent_requests=4,
+            host=HostSchedulerConfig(hosts={"127.0.0.1": HostLimit(max_in_flight=1, min_interval=0.05)}),
+        ),
+        fair_share=FairShareConfig(enabled=fair),
+    )
+    start = time.monotonic()
+    try:
+        executor = await AIOScrapper.create([scrapper], config=config)
+        await executor.start()
+        await executor.close()
+    finally:
+        await runner.cleanup()
+    return max(scrapper.done["localhost"]) - start, max(scrapper.done["127.0.0.1"]) - start, scrapper
+
+
+@pytest.mark.parametrize("fair", [False, True])
+def test_throttled_host_does_not_block_other_hosts(fair: bool) -> None:
+    fast_done, slow_done, scrapper = asyncio.run(crawl(fair))
+
+    assert len(scrapper.done["127.0.0.1"]) == 40
+    assert len(scrapper.done["localhost"]) == 5
+    assert slow_done > 1.5
+    assert fast_done < 0.5